@@ -2,45 +2,51 @@
 // This file contains the cell renderer functions for AG Grid components.
 // Loaded before helpers and init scripts.
 
-// ---- Row striping (all grids) ----
-// Use AG Grid's built-in classes (`ag-row-even` / `ag-row-odd`) instead of custom
-// rowClassRules so striping works without any grid-specific configuration.
-(function ensureStripedRowsCss() {
-    if (document.getElementById('vdm-striped-rows-css')) return;
-    const style = document.createElement('style');
-    style.id = 'vdm-striped-rows-css';
-    style.textContent = `
-      .ag-theme-alpine-dark .ag-row-even .ag-cell { background-color: rgba(255,255,255,0.06); }
-      .ag-theme-alpine-dark .ag-row-odd  .ag-cell { background-color: rgba(0,0,0,0.00); }
-
-      /* Allow multi-line header labels so we can keep columns narrow.
-         TODO(dashboard/metrics): This does not appear to impact the metrics grids
-         in practice (likely CSS specificity or header DOM differences). Revisit with
-         a metrics-scoped headerClass and targeted CSS once we confirm the exact
-         header markup produced by dash-ag-grid.
-      */
-      .ag-theme-alpine-dark .ag-header-cell-label {
-        white-space: normal;
-      }
-      .ag-theme-alpine-dark .ag-header-cell-text {
-        white-space: normal;
-        line-height: 1.1;
-      }
-      .ag-theme-alpine-dark .ag-header-cell-label .ag-header-cell-label-text {
-        white-space: normal;
-      }
-
-      /* Provider badge styling shared across the dashboard (AG Grid + non-grid).
-         Keep this minimal: Bootstrap provides the color + pill shape. */
-      .vdm-provider-badge {
-        font-size: 11px;
-        font-weight: 500;
-        letter-spacing: 0.2px;
-      }
-    `;
-    document.head.appendChild(style);
-})();
-
+// Row striping, header wrapping and badge styles live in vdm-grid-theme.css.
+
+
+// Shared renderer constants. Declared with `var` (not const) so a repeated
+// script load does not throw on redeclaration.
+var VDM_ICON_IMG_STYLE = Object.freeze({
+    width: '16px',
+    height: '16px',
+    borderRadius: '3px',
+    marginRight: '6px',
+    verticalAlign: 'text-bottom',
+    objectFit: 'cover',
+});
+var VDM_ICON_WRAP_STYLE = Object.freeze({ display: 'inline-flex', alignItems: 'center' });
+
+// Memoized cell body: re-renders only when the id or icon URL changes.
+// Created lazily so React does not need to be loaded before this script.
+var vdmModelIdCell = vdmModelIdCell || null;
+
+function vdmGetModelIdCell() {
+    if (!vdmModelIdCell) {
+        vdmModelIdCell = React.memo(
+            function ModelIdCell(props) {
+                // Compact size aligned with existing row height.
+                const img = React.createElement('img', {
+                    src: props.url,
+                    alt: '',
+                    width: 16,
+                    height: 16,
+                    style: VDM_ICON_IMG_STYLE,
+                });
+                return React.createElement(
+                    'span',
+                    { style: VDM_ICON_WRAP_STYLE },
+                    img,
+                    React.createElement('span', null, props.id)
+                );
+            },
+            function(a, b) {
+                return a.id === b.id && a.url === b.url;
+            }
+        );
+    }
+    return vdmModelIdCell;
+}
 
 // Render model id with optional icon.
 // Contract: Python row shaping (`models_row_data`) must provide `model_icon_url`
@@ -50,93 +56,45 @@ window.vdmModelIdWithIconRenderer = function(params) {
     const url = params && params.data && params.data.model_icon_url;
 
     if (!url) {
-        return React.createElement('span', null, id);
+        // Plain text child: no wrapper element to mount or reconcile.
+        return id;
     }
 
-    // Only allow http(s) URLs.
-    let parsed;
-    try {
-        parsed = new URL(url);
-    } catch (e) {
-        return React.createElement('span', null, id);
-    }
-    if (parsed.protocol !== 'http:' && parsed.protocol !== 'https:') {
-        return React.createElement('span', null, id);
-    }
-
-    // Compact size aligned with existing row height.
-    const img = React.createElement('img', {
-        src: parsed.toString(),
-        alt: '',
-        width: 16,
-        height: 16,
-        style: {
-            width: '16px',
-            height: '16px',
-            borderRadius: '3px',
-            marginRight: '6px',
-            verticalAlign: 'text-bottom',
-            objectFit: 'cover',
-        },
-    });
-
-    return React.createElement(
-        'span',
-        { style: { display: 'inline-flex', alignItems: 'center' } },
-        img,
-        React.createElement('span', null, id)
-    );
+    return React.createElement(vdmGetModelIdCell(), { id: id, url: url });
 };
 
 // Render model page link as React element (Dash uses React; DOM nodes cause React invariant #31)
+// Contract: `model_page_url` is null/undefined or an http(s) URL already
+// validated by Python row shaping (`models_row_data`).
+var VDM_LINK_DIM_STYLE = Object.freeze({ color: '#666', opacity: 0.3, fontSize: '16px' });
+var VDM_LINK_STYLE = Object.freeze({ textDecoration: 'none', color: '#666' });
+
+// The "no model page" cell is identical for every row: build the element once
+// (lazily, so React need not be loaded yet) and let React bail out on identity.
+var vdmNoModelPageEl = vdmNoModelPageEl || null;
+
 window.vdmModelPageLinkRenderer = function(params) {
     const url = params && params.data && params.data.model_page_url;
 
     if (!url) {
-        return React.createElement(
-            'span',
-            {
-                title: 'No model page available',
-                style: { color: '#666', opacity: 0.3, fontSize: '16px' },
-            },
-            ''
-        );
-    }
-
-    // Only allow http(s) URLs to avoid accidentally creating javascript: links
-    let parsed;
-    try {
-        parsed = new URL(url);
-    } catch (e) {
-        return React.createElement(
-            'span',
-            {
-                title: 'Invalid model page URL',
-                style: { color: '#666', opacity: 0.3, fontSize: '16px' },
-            },
-            ''
-        );
-    }
-
-    if (parsed.protocol !== 'http:' && parsed.protocol !== 'https:') {
-        return React.createElement(
-            'span',
-            {
-                title: 'Only http(s) URLs allowed',
-                style: { color: '#666', opacity: 0.3, fontSize: '16px' },
-            },
-            ''
-        );
+        if (!vdmNoModelPageEl) {
+            vdmNoModelPageEl = React.createElement(
+                'span',
+                { title: 'No model page available', style: VDM_LINK_DIM_STYLE },
+                ''
+            );
+        }
+        return vdmNoModelPageEl;
     }
 
     // Open in a new tab for better UX
     return React.createElement(
         'a',
         {
-            href: parsed.toString(),
+            href: url,
             target: '_blank',
             rel: 'noopener noreferrer',
-            style: { textDecoration: 'none', color: '#666' },
+            style: VDM_LINK_STYLE,
             title: 'Open model page',
         },
         ''
@@ -144,44 +102,48 @@ window.vdmModelPageLinkRenderer = function(params) {
 };
 
 
+// Match the look of `dbc.Badge(..., pill=True, className="me-2")`.
+// We avoid hard-coded hex colors so the badge stays consistent with the
+// project's Bootstrap theme (incl. dark mode adjustments).
+function vdmProviderBadgeClass(color) {
+    return `badge bg-${color} rounded-pill me-2 vdm-provider-badge`;
+}
+
+// Precomputed class strings for the Bootstrap theme colors, so the per-cell
+// render is a lookup instead of a template-string build.
+var VDM_PROVIDER_BADGE_CLASS = Object.freeze(Object.fromEntries(
+    ['primary', 'secondary', 'success', 'danger', 'warning', 'info', 'light', 'dark']
+        .map((color) => [color, vdmProviderBadgeClass(color)])
+));
+
 // Render a provider badge using Bootstrap's badge classes (DRY with dbc.Badge).
 // Contract: Python row shaping must provide `provider_color` as a valid Bootstrap
 // theme color name (e.g., "primary", "info", "danger", ...).
 window.vdmProviderBadgeRenderer = function(params) {
     const provider = params && params.value ? String(params.value) : '';
     if (!provider) {
-        return React.createElement('span', {}, '');
+        return '';
     }
 
     const color = (params.data && params.data.provider_color) || 'secondary';
 
-    // Match the look of `dbc.Badge(..., pill=True, className="me-2")`.
-    // We avoid hard-coded hex colors so the badge stays consistent with the
-    // project's Bootstrap theme (incl. dark mode adjustments).
     return React.createElement(
         'span',
-        {
-            className: `badge bg-${color} rounded-pill me-2 vdm-provider-badge`,
-        },
+        { className: VDM_PROVIDER_BADGE_CLASS[color] || vdmProviderBadgeClass(color) },
         provider
     );
 };
 
 
-// Format a number with thousand separators
-window.vdmFormattedNumberRenderer = function(params) {
-    const value = params && params.value;
-    if (value == null) {
-        return React.createElement('span', {}, '');
-    }
-
-    const num = Number(value);
-    if (isNaN(num)) {
-        return React.createElement('span', {}, '');
-    }
+// One shared formatter: `toLocaleString` builds an Intl.NumberFormat per call.
+// Exposed on window for the helpers script.
+window.vdmNumberFormat = window.vdmNumberFormat || new Intl.NumberFormat('en-US');
 
-    const formatted = num.toLocaleString('en-US');
-    return React.createElement('span', {}, formatted);
+// Cell-renderer variant of `vdmFormatNumberValue` (helpers script) for columns
+// that still declare `cellRenderer`. Returns a plain string (a valid React child)
+// instead of wrapping it in a span.
+window.vdmFormattedNumberRenderer = function(params) {
+    return window.vdmFormatNumberValue(params && params.value);
 };
 
 
@@ -2,19 +2,45 @@
 // This file contains utility functions for AG Grid components.
 // Loaded after renderers, before init script.
 
-// Date comparator for sorting by ISO date strings
-window.vdmDateComparator = function(date1, date2) {
-    if (!date1) return date2 ? -1 : 0;
-    if (!date2) return 1;
-
-    const d1 = new Date(date1).getTime();
-    const d2 = new Date(date2).getTime();
+// Resolve the dash-ag-grid API for a grid id.
+// Returns immediately when the grid is already registered (the common case).
+// Otherwise waits for it with one check per animation frame, up to timeoutMs.
+// Concurrent callers for the same grid share a single pending wait.
+// Stored on window (not a top-level const) so a repeated script load is harmless.
+window.__vdmGridApiWaiters = window.__vdmGridApiWaiters || new Map();
+
+function vdmLookupGridApi(gridId) {
+    const dag = window.dash_ag_grid;
+    return (dag && dag.getApi) ? dag.getApi(gridId) : null;
+}
+
+window.vdmWhenGridApiReady = function(gridId, timeoutMs) {
+    const api = vdmLookupGridApi(gridId);
+    if (api) {
+        return Promise.resolve(api);
+    }
 
-    if (isNaN(d1) && isNaN(d2)) return 0;
-    if (isNaN(d1)) return -1;
-    if (isNaN(d2)) return 1;
+    const waiters = window.__vdmGridApiWaiters;
+    const pending = waiters.get(gridId);
+    if (pending) {
+        return pending;
+    }
 
-    return d1 - d2;
+    const deadline = performance.now() + (timeoutMs || 5000);
+    const promise = new Promise(function(resolve) {
+        function check(now) {
+            const ready = vdmLookupGridApi(gridId);
+            if (ready || now >= deadline) {
+                waiters.delete(gridId);
+                resolve(ready || null);
+                return;
+            }
+            requestAnimationFrame(check);
+        }
+        requestAnimationFrame(check);
+    });
+    waiters.set(gridId, promise);
+    return promise;
 };
 
 
@@ -24,48 +50,36 @@ window.vdmCopySelectedModelIds = async function(gridId) {
         return { ok: false, message: 'No grid ID provided' };
     }
 
-    // Wait up to 5 seconds for the grid API to become available
-    const deadline = Date.now() + 5000;
-    while (Date.now() < deadline) {
-        const dag = window.dash_ag_grid;
-        if (dag && dag.getApi) {
-            const api = dag.getApi(gridId);
-            if (api) {
-                const selected = api.getSelectedRows ? api.getSelectedRows() : [];
-                const ids = (selected || []).map(r => r.id).filter(Boolean);
-
-                if (!ids.length) {
-                    return { ok: false, message: 'Nothing selected' };
-                }
-
-                await navigator.clipboard.writeText(ids.join('\\n'));
-                return { ok: true, message: 'Copied ' + ids.length + ' model IDs' };
-            }
-        }
-        await new Promise(resolve => setTimeout(resolve, 100));
+    const api = await window.vdmWhenGridApiReady(gridId, 5000);
+    if (!api) {
+        return { ok: false, message: 'Grid API not ready' };
     }
 
-    return { ok: false, message: 'Grid API not ready' };
-};
-
-// Copy a single string to clipboard
-window.vdmCopyText = async function(text) {
-    const value = (text == null) ? '' : String(text);
-    if (!value) {
-        return { ok: false, message: 'Nothing to copy' };
+    // Selected nodes are references into the grid's model; reading `data.id`
+    // directly avoids the row-object array `getSelectedRows()` builds.
+    const nodes = (api.getSelectedNodes && api.getSelectedNodes()) || [];
+    const ids = [];
+    for (let i = 0; i < nodes.length; i++) {
+        const id = nodes[i].data && nodes[i].data.id;
+        if (id) ids.push(id);
     }
 
-    // Prefer the async clipboard API when available.
-    try {
-        if (navigator.clipboard && navigator.clipboard.writeText) {
-            await navigator.clipboard.writeText(value);
-            return { ok: true, message: 'Copied' };
-        }
-    } catch (e) {
-        // Fall through to execCommand below.
+    if (!ids.length) {
+        return { ok: false, message: 'Nothing selected' };
     }
 
-    // Fallback for contexts where clipboard API is unavailable/blocked.
+    await navigator.clipboard.writeText(ids.join('\n'));
+    return { ok: true, message: 'Copied ' + ids.length + ' model IDs' };
+};
+
+// Async clipboard support is fixed for the page lifetime; check it once.
+var VDM_HAS_CLIPBOARD = !!(
+    window.isSecureContext && navigator.clipboard && navigator.clipboard.writeText
+);
+
+// Fallback for contexts where the clipboard API is unavailable/blocked. Only
+// reached off the happy path: it mutates the DOM and forces a layout.
+function vdmLegacyCopy(value) {
     try {
         const ta = document.createElement('textarea');
         ta.value = value;
@@ -83,14 +97,60 @@ window.vdmCopyText = async function(text) {
     } catch (e) {
         return { ok: false, message: 'Copy failed: ' + (e && e.message ? e.message : String(e)) };
     }
+}
+
+// Copy a single string to clipboard
+window.vdmCopyText = async function(text) {
+    const value = (text == null) ? '' : String(text);
+    if (!value) {
+        return { ok: false, message: 'Nothing to copy' };
+    }
+
+    if (VDM_HAS_CLIPBOARD) {
+        try {
+            await navigator.clipboard.writeText(value);
+            return { ok: true, message: 'Copied' };
+        } catch (e) {
+            // Permission denied (e.g. document not focused): try the fallback.
+        }
+    }
+    return vdmLegacyCopy(value);
 };
 
 
-// Utility function to escape HTML
+// Utility function to escape HTML (safe for text and quoted attribute values).
+// Plain string replace: no throwaway DOM element per call.
+var VDM_HTML_ESCAPES = Object.freeze({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#39;',
+});
+var VDM_HTML_ESCAPE_RE = /[&<>"']/g;
+
 window.escapeHtml = function(text) {
-    const div = document.createElement('div');
-    div.textContent = text;
-    return div.innerHTML;
+    return String(text == null ? '' : text).replace(
+        VDM_HTML_ESCAPE_RE,
+        function(c) { return VDM_HTML_ESCAPES[c]; }
+    );
+};
+
+
+// Format a number with thousand separators ('' for missing/non-numeric values).
+// Used directly as an AG Grid valueFormatter (see Python `numeric_col`), which
+// skips the React renderer entirely.
+window.vdmFormatNumberValue = function(value) {
+    if (value == null) {
+        return '';
+    }
+
+    const num = Number(value);
+    if (isNaN(num)) {
+        return '';
+    }
+
+    return window.vdmNumberFormat.format(num);
 };
 
 
@@ -124,5 +184,5 @@ window.vdmFormatDurationValue = function(ms) {
 window.vdmFormatDurationTooltip = function(ms) {
     const n = Number(ms);
     if (!isFinite(n) || n <= 0) return '0 ms';
-    return `${Math.round(n).toLocaleString('en-US')} ms`;
+    return `${window.vdmNumberFormat.format(Math.round(n))} ms`;
 };
@@ -4,17 +4,26 @@
 
 // Show a toast notification by triggering a hidden Dash button
 // The button click is bound to a Dash callback that shows a dbc.Toast
+// Rapid calls are coalesced: at most one trigger click per animation frame,
+// carrying the most recent payload.
 if (!window.vdmToast) {
-    window.vdmToast = function(level, message, modelId) {
+    let pendingToast = null;
+    let toastScheduled = false;
+    let toastTrigger = null;
+
+    const flushToast = function() {
+        toastScheduled = false;
+        const payload = pendingToast;
+        pendingToast = null;
+        if (!payload) return;
         try {
-            window.__vdm_last_toast_payload = JSON.stringify({
-                level: level || 'info',
-                message: message || '',
-                model_id: modelId,
-            });
-            const btn = document.getElementById('vdm-models-toast-trigger');
-            if (btn) {
-                btn.click();
+            window.__vdm_last_toast_payload = JSON.stringify(payload);
+            // Re-resolve if Dash re-rendered the page and replaced the button.
+            if (!toastTrigger || !toastTrigger.isConnected) {
+                toastTrigger = document.getElementById('vdm-models-toast-trigger');
+            }
+            if (toastTrigger) {
+                toastTrigger.click();
             } else {
                 console.debug('[vdm][toast] trigger not found');
             }
@@ -22,75 +31,69 @@ if (!window.vdmToast) {
             console.debug('[vdm][toast] failed', e);
         }
     };
+
+    window.vdmToast = function(level, message, modelId) {
+        pendingToast = {
+            level: level || 'info',
+            message: message || '',
+            model_id: modelId,
+        };
+        if (toastScheduled) return;
+        toastScheduled = true;
+        requestAnimationFrame(flushToast);
+    };
 }
 
 
-// Attach a native AG Grid cellClicked listener once the grid API is ready.
-// This avoids relying on dashGridOptions "function" plumbing.
-// (That indirection doesn't reliably invoke handlers.)
-if (!window.vdmAttachModelCellCopyListener) {
-    window.vdmAttachModelCellCopyListener = function(gridId) {
-        try {
-            const dag = window.dash_ag_grid;
-            if (!dag || !dag.getApi) {
-                return false;
-            }
-            const api = dag.getApi(gridId);
-            if (!api) {
-                return false;
-            }
+// Click-to-copy on Model ID cells, via one delegated document listener.
+// A single listener survives grid remounts and page navigation, so there is no
+// per-grid attach step and no need to wait for dash_ag_grid.getApi.
+(function initModelCellCopyDelegation() {
+    if (window.__vdmModelCellCopyDelegated) return;
+    window.__vdmModelCellCopyDelegated = true;
 
-            // Idempotent attach (per grid instance).
-            if (api.__vdmCopyListenerAttached) {
-                return true;
-            }
-            api.__vdmCopyListenerAttached = true;
-            console.log('[vdm][copy] attached model-id click listener', {gridId});
-
-            api.addEventListener('cellClicked', async function(e) {
-                try {
-                    if (!e || !e.colDef || e.colDef.field !== 'id') {
-                        return;
-                    }
-                    const id = e.value;
-                    console.log('[vdm][copy] cellClicked', {id});
-
-                    // Copy here (this is the only path we have proven works reliably in your browser).
-                    const r = await window.vdmCopyText(String(id));
-                    if (r && r.ok) {
-                        window.vdmToast('success', 'Copied model id: ' + String(id), id);
-                    } else {
-                        window.vdmToast('warning', (r && r.message) ? r.message : 'Copy failed', id);
-                    }
-                } catch (err) {
-                    console.log('[vdm][copy] cellClicked handler failed', err);
-                    window.vdmToast(
-                        'warning',
-                        'Copy failed: '
-                            + (err && err.message ? err.message : String(err)),
-                        null,
-                    );
-                }
-            });
+    // The Models page grids (src/dashboard/pages/models.py).
+    const MODEL_ID_CELL_SELECTOR = [
+        '#vdm-models-provider-grid .ag-cell[col-id="id"]',
+        '#vdm-models-profile-grid .ag-cell[col-id="id"]',
+    ].join(', ');
 
-            return true;
-        } catch (_) {
-            return false;
+    document.addEventListener('click', async function(e) {
+        const target = e.target;
+        const cell = target && target.closest ? target.closest(MODEL_ID_CELL_SELECTOR) : null;
+        if (!cell) {
+            return;
         }
-    };
-}
 
-// Attempt to attach immediately for the models grid.
-// (The dashboard also has a boot loop that waits for dash_ag_grid.getApi.)
-if (window.vdmAttachModelCellCopyListener) {
-    window.vdmAttachModelCellCopyListener('vdm-models-grid');
-}
+        const id = (cell.textContent || '').trim();
+        if (!id) {
+            return;
+        }
+
+        try {
+            const r = await window.vdmCopyText(id);
+            if (r && r.ok) {
+                window.vdmToast('success', 'Copied model id: ' + id, id);
+            } else {
+                window.vdmToast('warning', (r && r.message) ? r.message : 'Copy failed', id);
+            }
+        } catch (err) {
+            console.log('[vdm][copy] model id click handler failed', err);
+            window.vdmToast(
+                'warning',
+                'Copy failed: ' + (err && err.message ? err.message : String(err)),
+                null,
+            );
+        }
+    }, true);
+})();
 
 // dash-ag-grid expects functions under dashAgGridFunctions (kept for other formatters/comparators)
 window.dashAgGridFunctions = window.dashAgGridFunctions || {};
 
 // Helpers are resolved via dashAgGridFunctions when referenced by name in
 // valueGetter / tooltipValueGetter / comparator declarations.
+window.dashAgGridFunctions.vdmFormatNumberValue = window.vdmFormatNumberValue;
 window.dashAgGridFunctions.vdmFormatDurationValue = window.vdmFormatDurationValue;
 window.dashAgGridFunctions.vdmFormatDurationTooltip = window.vdmFormatDurationTooltip;
 
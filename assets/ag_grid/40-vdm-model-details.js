@@ -0,0 +1,229 @@
+// Vandamme Dashboard - Models page detail drawer
+// Fills the drawer slots from `vdm-models-detail-store` in the browser
+// (dash_clientside.vdm_models.render_model_details), so a row click does not
+// round-trip to the server. The drawer layout itself is static (Python
+// `model_details_drawer`); this returns only the per-slot values, as strings or
+// Dash component descriptors ({namespace, type, props}).
+
+var VDM_MONO_FONT = 'ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas';
+
+function vdmHtml(type, props) {
+    return { namespace: 'dash_html_components', type: type, props: props || {} };
+}
+
+function vdmDbc(type, props) {
+    return { namespace: 'dash_bootstrap_components', type: type, props: props || {} };
+}
+
+// Same as Python `components.ui.monospace` for plain values.
+function vdmMonospace(value) {
+    return vdmHtml('Span', { children: String(value), style: { fontFamily: VDM_MONO_FONT } });
+}
+
+function vdmMuted(text) {
+    return vdmHtml('Span', { children: text, className: 'text-muted' });
+}
+
+// Same rules as Python `components.ui.provider_badge`.
+var VDM_PROVIDER_FIXED_COLORS = Object.freeze({
+    openai: 'primary',
+    openrouter: 'info',
+    anthropic: 'danger',
+    poe: 'success',
+});
+var VDM_PROVIDER_PALETTE = Object.freeze([
+    'primary', 'success', 'info', 'warning', 'danger', 'secondary',
+]);
+
+// Badge descriptors per provider name; the same few providers repeat across clicks.
+var vdmProviderBadgeCache = vdmProviderBadgeCache || new Map();
+
+function vdmProviderBadge(provider) {
+    let badge = vdmProviderBadgeCache.get(provider);
+    if (!badge) {
+        badge = vdmBuildProviderBadge(provider);
+        vdmProviderBadgeCache.set(provider, badge);
+    }
+    return badge;
+}
+
+function vdmBuildProviderBadge(provider) {
+    const p = String(provider || '').trim();
+    const key = p.toLowerCase();
+    let color = VDM_PROVIDER_FIXED_COLORS[key];
+    if (!color) {
+        let sum = 0;
+        for (const ch of key) sum += ch.codePointAt(0);
+        color = VDM_PROVIDER_PALETTE[sum % VDM_PROVIDER_PALETTE.length];
+    }
+    return vdmDbc('Badge', { children: p, color: color, pill: true, className: 'me-2' });
+}
+
+// Pretty-print JSON with sorted keys (Python `json.dumps(sort_keys=True, indent=2)`),
+// stopping after `maxLines` lines: large provider payloads are never fully
+// serialized just to show the first screenful. Appends '...' when truncated.
+var VDM_JSON_HEAD_STOP = {};
+
+function vdmJsonHead(value, maxLines) {
+    const lines = [];
+    let line = '';
+
+    function newline(depth) {
+        lines.push(line);
+        // A newline means more output follows, so reaching the cap truncates.
+        if (lines.length >= maxLines) throw VDM_JSON_HEAD_STOP;
+        line = '  '.repeat(depth);
+    }
+
+    function write(v, depth) {
+        if (Array.isArray(v)) {
+            if (!v.length) {
+                line += '[]';
+                return;
+            }
+            line += '[';
+            for (let i = 0; i < v.length; i++) {
+                newline(depth + 1);
+                write(v[i] === undefined ? null : v[i], depth + 1);
+                if (i < v.length - 1) line += ',';
+            }
+            newline(depth);
+            line += ']';
+        } else if (v && typeof v === 'object') {
+            const keys = Object.keys(v).sort();
+            if (!keys.length) {
+                line += '{}';
+                return;
+            }
+            line += '{';
+            for (let i = 0; i < keys.length; i++) {
+                newline(depth + 1);
+                line += JSON.stringify(keys[i]) + ': ';
+                write(v[keys[i]], depth + 1);
+                if (i < keys.length - 1) line += ',';
+            }
+            newline(depth);
+            line += '}';
+        } else {
+            line += v === undefined ? 'null' : JSON.stringify(v);
+        }
+    }
+
+    try {
+        write(value, 0);
+    } catch (e) {
+        if (e !== VDM_JSON_HEAD_STOP) throw e;
+        return lines.join('\n') + '\n...';
+    }
+    lines.push(line);
+    return lines.join('\n');
+}
+
+var VDM_DETAIL_ICON_STYLE = Object.freeze({
+    width: '96px',
+    height: '96px',
+    objectFit: 'contain',
+    borderRadius: '10px',
+    backgroundColor: 'rgba(255,255,255,0.06)',
+    padding: '8px',
+});
+
+var VDM_RAW_JSON_MAX_LINES = 40;
+
+// Static pieces, built once and shared between renders (Dash does not mutate
+// returned component descriptors).
+var VDM_EMPTY_DIV = vdmHtml('Div');
+var VDM_ICON_PLACEHOLDER = vdmHtml('Div', { style: Object.freeze({ width: '96px', height: '96px' }) });
+var VDM_MUTED_DASH = vdmMuted('—');
+
+// Detail table value cells, in the order of Python MODEL_DETAIL_FIELD_KEYS
+// (components/ui.py), which lays out one `vdm-model-details-field-<key>` cell each.
+var VDM_DETAIL_FIELD_KEYS = Object.freeze([
+    'model', 'provider', 'owned_by', 'modality', 'created',
+    'context_length', 'max_output_tokens',
+    'pricing_in', 'pricing_out',
+]);
+
+// Outputs: icon, title, page link, one per detail field, description, raw JSON.
+var VDM_DETAIL_OUTPUT_COUNT = VDM_DETAIL_FIELD_KEYS.length + 5;
+
+function vdmRenderModelDetails(detailStore) {
+    const focused = detailStore && typeof detailStore === 'object' ? detailStore.focused : null;
+    if (!focused || typeof focused !== 'object' || Array.isArray(focused)) {
+        // Nothing selected: the drawer closes, keep its last contents.
+        return new Array(VDM_DETAIL_OUTPUT_COUNT).fill(window.dash_clientside.no_update);
+    }
+
+    const selectedCount = Number.isInteger(detailStore.selected_count)
+        ? detailStore.selected_count
+        : null;
+
+    const modelId = String(focused.id || '');
+    const provider = String(focused.provider || '');
+    const modelPageUrl = focused.model_page_url;
+    const modelIconUrl = focused.model_icon_url;
+    const descriptionFull = focused.description_full;
+    const pricingIn = focused.pricing_prompt_per_million;
+    const pricingOut = focused.pricing_completion_per_million;
+
+    const rawObj = {};
+    Object.keys(focused).forEach(function(k) {
+        if (k !== 'description_full' && k !== 'description_preview') rawObj[k] = focused[k];
+    });
+
+    const titleBits = [];
+    if (provider) titleBits.push(vdmProviderBadge(provider));
+    titleBits.push(vdmHtml('Span', { children: vdmMonospace(modelId), className: 'fw-semibold' }));
+    if (selectedCount && selectedCount > 1) {
+        titleBits.push(vdmDbc('Badge', {
+            children: 'Showing 1 of ' + selectedCount + ' selected',
+            color: 'secondary',
+            pill: true,
+            className: 'ms-2',
+        }));
+    }
+
+    const icon = (typeof modelIconUrl === 'string' && modelIconUrl)
+        ? vdmHtml('Img', { src: modelIconUrl, style: VDM_DETAIL_ICON_STYLE })
+        : VDM_ICON_PLACEHOLDER;
+
+    const pageButton = (typeof modelPageUrl === 'string' && modelPageUrl)
+        ? vdmDbc('Button', {
+            children: 'Open provider page',
+            href: modelPageUrl,
+            target: '_blank',
+            external_link: true,
+            color: 'primary',
+            outline: true,
+            size: 'sm',
+        })
+        : VDM_EMPTY_DIV;
+
+    // created_iso is the yyyy-mm-dd string from models_row_data, or null.
+    const createdDay = focused.created_iso;
+
+    const cells = {
+        model: vdmMonospace(modelId),
+        provider: vdmMonospace(provider || '—'),
+        owned_by: vdmMonospace(focused.owned_by || '—'),
+        modality: vdmMonospace(focused.architecture_modality || '—'),
+        created: typeof createdDay === 'string' && createdDay.length === 10
+            ? vdmMonospace(createdDay)
+            : VDM_MUTED_DASH,
+        context_length: vdmMonospace(focused.context_length || '—'),
+        max_output_tokens: vdmMonospace(focused.max_output_tokens || '—'),
+        pricing_in: pricingIn ? vdmMonospace(pricingIn) : VDM_MUTED_DASH,
+        pricing_out: pricingOut ? vdmMonospace(pricingOut) : VDM_MUTED_DASH,
+    };
+
+    return [icon, vdmHtml('Div', { children: titleBits }), pageButton]
+        .concat(VDM_DETAIL_FIELD_KEYS.map(function(key) { return cells[key]; }))
+        .concat([
+            (typeof descriptionFull === 'string' && descriptionFull) ? descriptionFull : '—',
+            vdmJsonHead(rawObj, VDM_RAW_JSON_MAX_LINES),
+        ]);
+}
+
+window.dash_clientside = window.dash_clientside || {};
+window.dash_clientside.vdm_models = window.dash_clientside.vdm_models || {};
+window.dash_clientside.vdm_models.render_model_details = vdmRenderModelDetails;
@@ -0,0 +1,120 @@
+// Vandamme Dashboard - Models page provider notice
+// Renders the docs link / error alert under the provider dropdown from the
+// `vdm-models-provider-notice` store (dash_clientside.vdm_models.render_provider_notice).
+// The server only sends the plain fields; the Bootstrap components are built here.
+// Uses vdmHtml/vdmDbc/VDM_EMPTY_DIV from 40-vdm-model-details.js.
+
+// Display properties per models-fetch error type (see services.models._classify_error).
+var VDM_MODELS_ERROR_CONFIG = Object.freeze({
+    timeout: Object.freeze({
+        icon: '⏱️',
+        color: 'warning',
+        suggestion: 'Check network connectivity or verify the provider is accessible',
+    }),
+    connection: Object.freeze({
+        icon: '🔌',
+        color: 'danger',
+        suggestion: "Verify the provider's base_url is correct and accessible",
+    }),
+    auth: Object.freeze({
+        icon: '🔑',
+        color: 'warning',
+        suggestion: "Check API key or run 'vdm oauth login <provider>'",
+    }),
+    server_error: Object.freeze({
+        icon: '🔴',
+        color: 'danger',
+        suggestion: 'The provider API may be experiencing issues. Try again later',
+    }),
+    not_found: Object.freeze({
+        icon: '🔍',
+        color: 'info',
+        suggestion: 'The provider or models endpoint may not be configured',
+    }),
+});
+var VDM_MODELS_ERROR_DEFAULT = Object.freeze({ icon: '⚠️', color: 'secondary', suggestion: null });
+
+// Color-coded alert with icon, provider name, error message and a suggestion.
+function vdmModelsErrorAlert(errorMessage, errorType, provider) {
+    const config = VDM_MODELS_ERROR_CONFIG[errorType] || VDM_MODELS_ERROR_DEFAULT;
+    const parts = [
+        vdmHtml('Strong', { children: config.icon + ' Models fetch failed' }),
+        vdmHtml('Br'),
+        vdmHtml('Span', { children: 'Provider: ' + (provider || 'default'), className: 'text-muted small' }),
+        vdmHtml('Br'),
+        vdmHtml('Span', { children: errorMessage, className: 'small' }),
+    ];
+    if (config.suggestion) {
+        parts.push(
+            vdmHtml('Hr', { className: 'my-2' }),
+            vdmHtml('Span', { children: '💡 Suggestion: ', className: 'small fw-semibold' }),
+            vdmHtml('Span', { children: config.suggestion, className: 'small' })
+        );
+    }
+    return vdmDbc('Alert', { children: parts, color: config.color, className: 'small' });
+}
+
+// Always-visible docs link once a provider's models loaded.
+function vdmModelsDocsLink(modelsUrl) {
+    return vdmHtml('Div', {
+        children: [
+            vdmHtml('Span', { children: 'Documentation: ', className: 'text-muted small me-2' }),
+            vdmDbc('Button', {
+                children: 'View available models',
+                href: modelsUrl,
+                target: '_blank',
+                external_link: true,
+                color: 'info',
+                size: 'sm',
+                outline: true,
+            }),
+        ],
+        className: 'mb-3',
+    });
+}
+
+// Models list unavailable, but the provider documents its models elsewhere.
+function vdmModelsUnavailableAlert(modelsUrl, errorMessage) {
+    const parts = [
+        vdmHtml('P', { children: 'Models list is not available for this provider.', className: 'mb-2 small' }),
+        vdmHtml('P', {
+            children: [
+                'View available models at: ',
+                vdmDbc('Button', {
+                    children: 'Open documentation',
+                    href: modelsUrl,
+                    target: '_blank',
+                    external_link: true,
+                    color: 'info',
+                    size: 'sm',
+                    className: 'ms-2',
+                }),
+            ],
+            className: 'mb-0 small',
+        }),
+    ];
+    if (errorMessage) {
+        parts.splice(1, 0, vdmHtml('P', {
+            children: 'Reason: ' + errorMessage,
+            className: 'text-muted small mb-2',
+        }));
+    }
+    return vdmDbc('Alert', { children: parts, color: 'info', className: 'small' });
+}
+
+// notice: {has_models, models_url, error_message, error_type, provider} or null.
+function vdmRenderProviderNotice(notice) {
+    if (!notice) return VDM_EMPTY_DIV;
+    if (notice.has_models) {
+        return notice.models_url ? vdmModelsDocsLink(notice.models_url) : VDM_EMPTY_DIV;
+    }
+    if (notice.models_url) return vdmModelsUnavailableAlert(notice.models_url, notice.error_message);
+    if (notice.error_message) {
+        return vdmModelsErrorAlert(notice.error_message, notice.error_type, notice.provider);
+    }
+    return VDM_EMPTY_DIV;
+}
+
+window.dash_clientside = window.dash_clientside || {};
+window.dash_clientside.vdm_models = window.dash_clientside.vdm_models || {};
+window.dash_clientside.vdm_models.render_provider_notice = vdmRenderProviderNotice;
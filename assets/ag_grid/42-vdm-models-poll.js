@@ -0,0 +1,20 @@
+// Vandamme Dashboard - Models page polling
+// Pauses the `vdm-models-poll` interval while the browser tab is hidden, so an
+// idle background tab stops calling the provider/profile refresh callbacks.
+// Polling resumes (with its normal 30s cadence) when the tab becomes visible.
+
+(function() {
+    'use strict';
+
+    function onModelsPage() {
+        return window.location.pathname.replace(/\/+$/, '') === '/dashboard/models';
+    }
+
+    function syncModelsPoll() {
+        const dc = window.dash_clientside;
+        if (!dc || typeof dc.set_props !== 'function' || !onModelsPage()) return;
+        dc.set_props('vdm-models-poll', { disabled: document.visibilityState === 'hidden' });
+    }
+
+    document.addEventListener('visibilitychange', syncModelsPoll);
+})();
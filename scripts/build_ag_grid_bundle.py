@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""Build the single-file AG Grid JS bundle served by the dashboard.
+
+Concatenates assets/ag_grid/NN-vdm-*.js (minified with esbuild when available)
+into assets/ag_grid/vdm-grid.bundle.js. The dashboard serves the bundle instead
+of the individual files whenever it is newer than all of them.
+"""
+
+import sys
+
+from src.dashboard.ag_grid.scripts import ag_grid_source_files, build_ag_grid_bundle
+
+
+def main() -> int:
+    """Write the bundle and report its size."""
+    minify = "--no-minify" not in sys.argv[1:]
+    sources = ag_grid_source_files()
+    if not sources:
+        print("No AG Grid source scripts found", file=sys.stderr)
+        return 1
+
+    bundle = build_ag_grid_bundle(minify=minify)
+    source_bytes = sum(p.stat().st_size for p in sources)
+    print(
+        f"Wrote {bundle} ({bundle.stat().st_size} bytes from {len(sources)} files, "
+        f"{source_bytes} bytes)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -233,14 +233,14 @@ class ModelsListService:
 
         Uses ProviderResolver for validation.
         """
-        all_providers = self._config.provider_manager.list_providers()
+        provider_names = self._config.provider_manager.provider_names()
         try:
-            self._resolver.validate_provider_exists(provider_name, all_providers)
+            self._resolver.validate_provider_exists(provider_name, provider_names)
         except ValueError as e:
-            # Convert ValueError to HTTPStatusError for API layer
-            available = ", ".join(sorted(all_providers.keys()))
+            # Convert ValueError to HTTPStatusError for API layer (message already
+            # lists the available providers)
             raise httpx.HTTPStatusError(
-                message=f"Provider '{provider_name}' not found. Available providers: {available}",
+                message=str(e),
                 request=None,  # type: ignore[arg-type]
                 response=None,  # type: ignore[arg-type]
             ) from e
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any, TypeVar
 
-from src.core.safe_ops import JSON_PARSE_EXCEPTIONS
+from src.core.safe_ops import JSON_PARSE_EXCEPTIONS, json_loads
 
 T = TypeVar("T")
 
@@ -24,7 +23,7 @@ def safe_json_loads(value: str | None, *, default: T) -> T:
         return default
 
     try:
-        return json.loads(value)  # type: ignore[no-any-return]
+        return json_loads(value)  # type: ignore[no-any-return]
     except JSON_PARSE_EXCEPTIONS as e:
         # Expected during streaming - log at DEBUG to avoid noise
         logger.debug(f"JSON parse error in content_utils: {type(e).__name__}: {e}")
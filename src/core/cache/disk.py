@@ -15,6 +15,13 @@ from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+# orjson reads and writes large cache payloads several times faster than the
+# stdlib; optional, the json module is used when it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,6 +47,11 @@ class DiskJsonCache(ABC):
     - _deserialize(): Converts JSON dict back to domain object
     """
 
+    # Parsed cache files by path, valid while the file's (mtime_ns, size) is
+    # unchanged: repeated reads within the TTL skip re-parsing. Shared by all
+    # instances; the parsed data is shared too and must not be mutated.
+    _parsed_files: dict[str, tuple[int, int, dict[str, Any]]] = {}
+
     def __init__(
         self,
         cache_dir: Path,
@@ -72,7 +84,7 @@ class DiskJsonCache(ABC):
             if not last_updated_str:
                 return False
 
-            last_updated = datetime.fromisoformat(last_updated_str.replace("Z", "+00:00"))
+            last_updated = datetime.fromisoformat(last_updated_str)
             now = datetime.now(UTC)
             return (now - last_updated) <= self.ttl
         except (ValueError, TypeError) as e:
@@ -84,13 +96,26 @@ class DiskJsonCache(ABC):
         # Ensure parent directory exists
         path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Compact JSON: cache files are machine-read, and indentation roughly
+        # doubles their size. Keys stay sorted so files diff deterministically.
         temp_path = path.with_suffix(".json.tmp")
         try:
-            temp_path.write_text(
-                json.dumps(data, indent=2, sort_keys=True) + "\n",
-                encoding="utf-8",
-            )
+            if orjson is not None:
+                temp_path.write_bytes(
+                    orjson.dumps(
+                        data,
+                        option=orjson.OPT_SORT_KEYS
+                        | orjson.OPT_NON_STR_KEYS
+                        | orjson.OPT_APPEND_NEWLINE,
+                    )
+                )
+            else:
+                temp_path.write_text(
+                    json.dumps(data, sort_keys=True, separators=(",", ":")) + "\n",
+                    encoding="utf-8",
+                )
             temp_path.replace(path)
+            DiskJsonCache._parsed_files.pop(str(path), None)
             logger.debug(f"Cache written to {path}")
         except (OSError, ValueError) as e:
             # File system errors during write
@@ -112,11 +137,24 @@ class DiskJsonCache(ABC):
     def _read_cache_file(self, path: Path) -> dict[str, Any] | None:
         """Read and validate cache file."""
         try:
-            if not path.exists():
+            try:
+                st = path.stat()
+            except FileNotFoundError:
                 return None
 
-            with path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            key = str(path)
+            memo = DiskJsonCache._parsed_files.get(key)
+            if memo is not None and memo[:2] == (st.st_mtime_ns, st.st_size):
+                data = memo[2]
+            else:
+                if orjson is not None:
+                    # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+                    data = orjson.loads(path.read_bytes())
+                else:
+                    with path.open("r", encoding="utf-8") as f:
+                        data = json.load(f)
+                if isinstance(data, dict):
+                    DiskJsonCache._parsed_files[key] = (st.st_mtime_ns, st.st_size, data)
 
             # Validate schema version
             if data.get("schema_version") != self.schema_version:
@@ -210,6 +248,7 @@ class DiskJsonCache(ABC):
         if path.exists():
             try:
                 path.unlink()
+                DiskJsonCache._parsed_files.pop(str(path), None)
                 logger.debug(f"Cache cleared: {path}")
                 return True
             except Exception as e:
@@ -16,6 +16,7 @@ Benefits:
 5. Clear contracts - protocols document exact interfaces
 """
 
+from collections.abc import Collection
 from typing import Any, Protocol, runtime_checkable
 
 
@@ -180,13 +181,13 @@ class ProviderResolverProtocol(Protocol):
     def resolve_provider(
         self,
         model: str,
-        available_providers: dict[str, object],
+        available_providers: Collection[str],
     ) -> tuple[str, str]: ...
 
     def validate_provider_exists(
         self,
         provider_name: str,
-        available_providers: dict[str, object],
+        available_providers: Collection[str],
     ) -> None: ...
 
     def get_provider_or_default(
@@ -18,6 +18,7 @@ class ProviderRegistry:
     def __init__(self) -> None:
         """Initialize an empty provider registry."""
         self._configs: dict[str, ProviderConfig] = {}
+        self._names: frozenset[str] | None = None
 
     def register(self, config: ProviderConfig) -> None:
         """Register a provider configuration.
@@ -26,6 +27,7 @@ class ProviderRegistry:
             config: The provider configuration to register.
         """
         self._configs[config.name] = config
+        self._names = None
 
     def get(self, provider_name: str) -> ProviderConfig | None:
         """Get provider config by name.
@@ -46,6 +48,19 @@ class ProviderRegistry:
         """
         return self._configs.copy()
 
+    def names(self) -> frozenset[str]:
+        """Return a snapshot of registered provider names.
+
+        The snapshot is rebuilt only after the registry changes, so membership
+        checks on the request path do not pay for a dict copy each time.
+
+        Returns:
+            A frozenset of provider names.
+        """
+        if self._names is None:
+            self._names = frozenset(self._configs)
+        return self._names
+
     def exists(self, provider_name: str) -> bool:
         """Check if provider is configured.
 
@@ -63,3 +78,4 @@ class ProviderRegistry:
         This is primarily useful for testing.
         """
         self._configs.clear()
+        self._names = None
@@ -570,6 +570,16 @@ class ProviderManager(ProviderClientFactory):
             self.load_provider_configs()
         return self._registry.list_all()
 
+    def provider_names(self) -> frozenset[str]:
+        """Names of all configured providers, for membership checks.
+
+        Unlike list_providers(), this returns the registry's cached snapshot
+        instead of copying the config dict on every call.
+        """
+        if not self._loaded:
+            self.load_provider_configs()
+        return self._registry.names()
+
     def get_effective_timeout(
         self, provider_name: str, profile: "ProfileConfig | None"
     ) -> int | None:
@@ -13,7 +13,9 @@ This service provides a single source of truth for:
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any
+from collections.abc import Collection
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.core.profile_manager import ProfileManager
@@ -21,6 +23,22 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _available_providers_label(names: frozenset[str]) -> str:
+    """Sorted, comma-separated provider names for "not found" errors.
+
+    Cached per provider set so cascading failures against the same registry
+    snapshot do not re-sort and re-join the names on every error.
+    """
+    return ", ".join(sorted(names))
+
+
+def _provider_not_found(provider_name: str, available_providers: Collection[str]) -> ValueError:
+    """Build the ValueError raised when a provider is not configured."""
+    available = _available_providers_label(frozenset(available_providers))
+    return ValueError(f"Provider '{provider_name}' not found. Available providers: {available}")
+
+
 class ProviderResolver:
     """Centralized provider resolution and validation.
 
@@ -67,7 +85,7 @@ class ProviderResolver:
     def resolve_provider(
         self,
         model: str,
-        available_providers: dict[str, Any],
+        available_providers: Collection[str],
     ) -> tuple[str, str]:
         """Resolve provider from model with profile support.
 
@@ -78,7 +96,8 @@ class ProviderResolver:
 
         Args:
             model: Model name that may contain profile or provider prefix
-            available_providers: Dict of available provider names
+            available_providers: Available provider names. A provider dict works,
+                but hot callers can pass a prebuilt frozenset snapshot instead.
 
         Returns:
             Tuple of (provider_name, resolved_model)
@@ -86,51 +105,48 @@ class ProviderResolver:
         Raises:
             ValueError: If resolved provider not in available_providers
         """
-        # Check for profile prefix FIRST
-        if self._profile_manager and ":" in model:
-            potential_profile, model_part = model.split(":", 1)
-            if self._profile_manager.is_profile(potential_profile):
-                profile = self._profile_manager.get_profile(potential_profile)
-                # Check if model_part is in profile's aliases
-                if profile and model_part in profile.aliases:
-                    # Use the alias target (which includes provider prefix)
-                    resolved_model = profile.aliases[model_part]
-                    provider_name, actual_model = self.parse_provider_prefix(resolved_model)
-                    if provider_name:
-                        return self._validate_and_return(
-                            provider_name, actual_model, available_providers
-                        )
-                # If not in profile aliases, fall through to normal resolution with model_part
-                model = model_part
-
-        # Check for provider prefix in model
-        provider_name, actual_model = self.parse_provider_prefix(model)
-
-        if provider_name:
-            return self._validate_and_return(provider_name, actual_model, available_providers)
-
-        # Use default provider
-        return self._validate_and_return(self._default_provider, model, available_providers)
-
-    def validate_provider_exists(
+        head, sep, tail = model.partition(":")
+        if not sep or not head:
+            # Common case (e.g. "gpt-4o"): no prefix, use default provider. An
+            # empty prefix (":free") is not a provider either; the model is kept as is.
+            provider_name, actual_model = self._default_provider, model
+        elif self._profile_manager and self._profile_manager.is_profile(head):
+            # Profile prefix takes precedence over provider prefix
+            profile = self._profile_manager.get_profile(head)
+            target = profile.aliases.get(tail) if profile else None
+            prefix: str | None = None
+            if target:
+                # Use the alias target (which includes provider prefix)
+                prefix, actual_model = self.parse_provider_prefix(target)
+            if not prefix:
+                # If not in profile aliases, fall through to normal resolution with tail
+                prefix, actual_model = self.parse_provider_prefix(tail)
+            provider_name = prefix or self._default_provider
+        else:
+            # Provider prefix in model
+            provider_name, actual_model = head.lower(), tail
+
+        # Validation inlined from validate_provider_exists() to keep the hot path flat
+        if provider_name not in available_providers:
+            raise _provider_not_found(provider_name, available_providers)
+        return provider_name, actual_model
+
+    def validate_provider_exists(  # keep public: used by ModelsListService
         self,
         provider_name: str,
-        available_providers: dict[str, Any],
+        available_providers: Collection[str],
     ) -> None:
         """Validate provider exists, raise exception if not.
 
         Args:
             provider_name: Provider name to validate
-            available_providers: Dict of available provider names
+            available_providers: Available provider names (dict or set snapshot)
 
         Raises:
             ValueError: If provider not found
         """
         if provider_name not in available_providers:
-            available = ", ".join(sorted(available_providers.keys()))
-            raise ValueError(
-                f"Provider '{provider_name}' not found. Available providers: {available}"
-            )
+            raise _provider_not_found(provider_name, available_providers)
 
     def get_provider_or_default(
         self,
@@ -162,19 +178,3 @@ class ProviderResolver:
             return f"#{self._default_provider.lower()}"
 
         return self._default_provider
-
-    def _validate_and_return(
-        self,
-        provider_name: str,
-        model: str,
-        available_providers: dict[str, Any],
-    ) -> tuple[str, str]:
-        """Validate provider and return tuple.
-
-        Internal helper used by resolve_provider.
-
-        Raises:
-            ValueError: If provider not found in available_providers
-        """
-        self.validate_provider_exists(provider_name, available_providers)
-        return provider_name, model
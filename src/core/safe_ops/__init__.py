@@ -21,12 +21,14 @@ from .decorators import (
 )
 from .parsers import (
     JSON_PARSE_EXCEPTIONS,
+    json_loads,
     safe_json_loads,
 )
 
 __all__ = [
     "safe_json_loads",
     "JSON_PARSE_EXCEPTIONS",
+    "json_loads",
     "log_and_return_default",
     "log_and_reraise",
     "suppress_and_log",
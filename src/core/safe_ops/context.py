@@ -2,23 +2,66 @@
 
 from __future__ import annotations
 
-import contextlib
 import logging
-from collections.abc import Generator
-from typing import TypeVar
+from contextlib import AbstractContextManager
+from types import TracebackType
+from typing import Generic, TypeVar
+
+from .log_dispatch import bind_log_method
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
 
-@contextlib.contextmanager
+class _SuppressAndLog:
+    """Class-based context manager behind suppress_and_log().
+
+    Avoids the generator machinery of @contextlib.contextmanager, which is
+    measurable on per-request cleanup guards.
+    """
+
+    __slots__ = ("_exceptions", "_context", "_log_level", "_log_result")
+
+    def __init__(
+        self,
+        exceptions: tuple[type[Exception], ...],
+        context: str,
+        log_level: int,
+        log_result: bool,
+    ) -> None:
+        self._exceptions = exceptions
+        self._context = context
+        self._log_level = log_level
+        self._log_result = log_result
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> bool:
+        if exc_type is None:
+            if self._log_result and logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"{self._context}: completed successfully")
+            return False
+        if issubclass(exc_type, self._exceptions):
+            if logger.isEnabledFor(self._log_level):
+                msg = f"{self._context}: {exc_type.__name__}: {exc}"
+                bind_log_method(logger, self._log_level)(msg, exc_info=False)
+            return True
+        return False
+
+
 def suppress_and_log(
     *exceptions: type[Exception],
     context: str = "",
     log_level: int = logging.WARNING,
     log_result: bool = False,
-) -> Generator[None, None, None]:
+) -> AbstractContextManager[None]:
     """Context manager that suppresses exceptions after logging them.
 
     Use this to replace bare `except: pass` blocks.
@@ -43,37 +86,69 @@ def suppress_and_log(
         >>> ):
         >>>     cleanup_task()
     """
-    try:
-        yield
-        if log_result:
-            logger.debug(f"{context}: completed successfully")
-    except exceptions as e:
-        msg = f"{context}: {type(e).__name__}: {e}"
-        logger.log(log_level, msg, exc_info=False)
+    return _SuppressAndLog(exceptions, context, log_level, log_result)
+
+
+class _SoftFailResult(Generic[T]):
+    """Holder for the value produced inside a soft_fail() block."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: T) -> None:
+        self.value = value
+
+
+class _SoftFail(Generic[T]):
+    """Class-based context manager behind soft_fail()."""
+
+    __slots__ = ("_result", "_fallback_value", "_exceptions", "_context", "_log_level")
+
+    def __init__(
+        self,
+        fallback_value: T,
+        exceptions: tuple[type[Exception], ...],
+        context: str,
+        log_level: int,
+    ) -> None:
+        self._result = _SoftFailResult(fallback_value)
+        self._fallback_value = fallback_value
+        self._exceptions = exceptions
+        self._context = context
+        self._log_level = log_level
+
+    def __enter__(self) -> _SoftFailResult[T]:
+        return self._result
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> bool:
+        if exc_type is None or not issubclass(exc_type, self._exceptions):
+            return False
+        if logger.isEnabledFor(self._log_level):
+            msg = f"{self._context or 'operation'}: {exc_type.__name__}: {exc}"
+            bind_log_method(logger, self._log_level)(msg, exc_info=False)
+        self._result.value = self._fallback_value
+        return True
 
 
-@contextlib.contextmanager
 def soft_fail(
     *,
     fallback_value: T,
     exceptions: tuple[type[Exception], ...] = (Exception,),
     context: str = "",
     log_level: int = logging.WARNING,
-) -> Generator[list[T], None, None]:
+) -> AbstractContextManager[_SoftFailResult[T]]:
     """Context manager for operations that should soft-fail with a fallback.
 
-    Returns a mutable list where the first element is either the result
+    Returns a result holder whose ``value`` attribute is either the result
     or the fallback value.
 
     Example:
         >>> with soft_fail(fallback_value={}, context="Cache load") as result:
-        >>>     result[0] = load_from_cache()
-        >>> data = result[0]
+        >>>     result.value = load_from_cache()
+        >>> data = result.value
     """
-    result: list[T] = [fallback_value]
-    try:
-        yield result
-    except exceptions as e:
-        msg = f"{context or 'operation'}: {type(e).__name__}: {e}"
-        logger.log(log_level, msg, exc_info=False)
-        result[0] = fallback_value
+    return _SoftFail(fallback_value, exceptions, context, log_level)
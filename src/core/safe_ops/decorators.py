@@ -7,6 +7,8 @@ import logging
 from collections.abc import Callable
 from typing import ParamSpec, TypeVar
 
+from .log_dispatch import bind_log_method
+
 P = ParamSpec("P")
 R = TypeVar("R")
 
@@ -44,14 +46,21 @@ def log_and_return_default(
             ...
     """
 
+    log = bind_log_method(logger, log_level)
+
     def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        # Everything that does not depend on the call is resolved here, once, so
+        # the wrapper's happy path is just the try block around the call.
+        label = context or func.__name__
+        is_enabled = logger.isEnabledFor
+
         @functools.wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
             try:
                 return func(*args, **kwargs)
             except exceptions as e:
-                msg = f"{context or func.__name__}: {type(e).__name__}: {e}"
-                logger.log(log_level, msg, exc_info=include_traceback)
+                if is_enabled(log_level):
+                    log(f"{label}: {type(e).__name__}: {e}", exc_info=include_traceback)
                 return default
 
         return wrapper
@@ -80,14 +89,22 @@ def log_and_reraise(
             ...
     """
 
+    log = bind_log_method(logger, log_level)
+
     def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        label = context or func.__name__
+
         @functools.wraps(func)
         async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
             try:
                 return await func(*args, **kwargs)  # type: ignore[misc,no-any-return]
             except exceptions as e:
-                msg = f"{context or func.__name__}: {type(e).__name__}: {e}"
-                logger.log(log_level, msg, exc_info=True)
+                enabled = logger.isEnabledFor(log_level)
+                if not (enabled or reraise_type):
+                    raise
+                msg = f"{label}: {type(e).__name__}: {e}"
+                if enabled:
+                    log(msg, exc_info=True)
                 if reraise_type:
                     raise reraise_type(msg) from e
                 raise
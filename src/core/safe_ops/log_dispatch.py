@@ -0,0 +1,27 @@
+"""Level-specific logger method dispatch for safe_ops helpers."""
+
+from __future__ import annotations
+
+import functools
+import logging
+from collections.abc import Callable
+
+
+@functools.cache
+def bind_log_method(log: logging.Logger, level: int) -> Callable[..., None]:
+    """Return the level-specific method of `log` for `level`.
+
+    `Logger.log()` re-validates the level on every call; the standard levels map
+    straight to `debug()`/`warning()`/... instead. Custom levels fall back to a
+    `Logger.log` partial. Results are cached per (logger, level) pair.
+    """
+    method = {
+        logging.DEBUG: log.debug,
+        logging.INFO: log.info,
+        logging.WARNING: log.warning,
+        logging.ERROR: log.error,
+        logging.CRITICAL: log.critical,
+    }.get(level)
+    if method is not None:
+        return method
+    return functools.partial(log.log, level)
@@ -16,9 +16,38 @@ from __future__ import annotations
 import hashlib
 import logging
 import re
+from collections.abc import Callable
 
 logger = logging.getLogger(__name__)
 
+# Single-scan pre-filter: every substitution below requires one of these tokens,
+# so messages without them (the vast majority of log lines) skip all four regexes.
+_API_KEY_PREFILTER = re.compile(r"sk-|bearer|api[-_]key", re.IGNORECASE)
+
+# Pattern for API keys in various formats.
+# Matches: sk-xxx, Bearer xxx, x-api-key: xxx, "api_key": "xxx"
+_API_KEY_SUBSTITUTIONS: tuple[tuple[re.Pattern[str], Callable[[re.Match[str]], str]], ...] = (
+    (
+        re.compile(r"(sk-[a-zA-Z0-9]{20,})", re.IGNORECASE),
+        lambda m: f"sk-{get_api_key_hash(m.group(1)[3:])}",
+    ),
+    (
+        re.compile(r"(Bearer\s+[a-zA-Z0-9\-_\.]{20,})", re.IGNORECASE),
+        lambda m: f"Bearer {get_api_key_hash(m.group(0)[7:])}",
+    ),
+    (
+        re.compile(r"(x-api-key:\s*[a-zA-Z0-9\-_\.]{20,})", re.IGNORECASE),
+        lambda m: f"x-api-key: {get_api_key_hash(m.group(0)[11:])}",
+    ),
+    (
+        re.compile(r"(\"api_key\":\s*\"[a-zA-Z0-9\-_\.]{20,}\")", re.IGNORECASE),
+        lambda m: f'"api_key": "{get_api_key_hash(m.group(0)[13:-1])}"',
+    ),
+)
+
+# Client-facing message used when debug details must not be exposed.
+_GENERIC_ERROR_MESSAGE = "An error occurred while processing your request"
+
 
 def get_api_key_hash(api_key: str) -> str:
     """Return an 8-char stable hash for an API key.
@@ -71,33 +100,12 @@ def hash_api_keys_in_message(message: str) -> str:
         The message with secrets replaced.
     """
 
-    if not message:
+    if not message or not _API_KEY_PREFILTER.search(message):
         return message
 
-    # Pattern for API keys in various formats.
-    # Matches: sk-xxx, Bearer xxx, x-api-key: xxx, "api_key": "xxx"
-    from collections.abc import Callable
-    from re import Match
-
-    substitutions: list[tuple[str, Callable[[Match[str]], str]]] = [
-        (r"(sk-[a-zA-Z0-9]{20,})", lambda m: f"sk-{get_api_key_hash(m.group(1)[3:])}"),
-        (
-            r"(Bearer\s+[a-zA-Z0-9\-_\.]{20,})",
-            lambda m: f"Bearer {get_api_key_hash(m.group(0)[7:])}",
-        ),
-        (
-            r"(x-api-key:\s*[a-zA-Z0-9\-_\.]{20,})",
-            lambda m: f"x-api-key: {get_api_key_hash(m.group(0)[11:])}",
-        ),
-        (
-            r"(\"api_key\":\s*\"[a-zA-Z0-9\-_\.]{20,}\")",
-            lambda m: f'"api_key": "{get_api_key_hash(m.group(0)[13:-1])}"',
-        ),
-    ]
-
     redacted = message
-    for pattern, replacement in substitutions:
-        redacted = re.sub(pattern, replacement, redacted, flags=re.IGNORECASE)
+    for pattern, replacement in _API_KEY_SUBSTITUTIONS:
+        redacted = pattern.sub(replacement, redacted)
 
     return redacted
 
@@ -129,7 +137,6 @@ def safe_exception_message(
     """
     if include_debug:
         # Debug mode: include exception type and message (but never stack trace)
-        return f"{type(exception).__name__}: {str(exception)}"
-    else:
-        # Production mode: generic message without internal details
-        return "An error occurred while processing your request"
+        return f"{exception.__class__.__name__}: {exception}"
+    # Production mode: generic message without internal details
+    return _GENERIC_ERROR_MESSAGE
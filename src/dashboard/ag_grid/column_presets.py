@@ -31,6 +31,53 @@ def last_col(
     }
 
 
+def time_col(*, sort: str | None = "desc") -> dict[str, Any]:
+    """Log timestamp ("HH:MM:SS"), with the relative age as tooltip."""
+    return {
+        "headerName": "Time",
+        "field": "time_formatted",
+        "sortable": True,
+        "filter": True,
+        "resizable": True,
+        "width": 100,
+        "suppressSizeToFit": True,
+        "tooltipField": "time_relative",
+        **({"sort": sort} if sort else {}),
+    }
+
+
+def provider_badge_col(
+    *,
+    width: int = 130,
+    sort: str | None = None,
+) -> dict[str, Any]:
+    return {
+        "headerName": "Provider",
+        "field": "provider",
+        "sortable": True,
+        "filter": True,
+        "resizable": True,
+        "width": width,
+        "suppressSizeToFit": True,
+        "cellRenderer": "vdmProviderBadgeRenderer",
+        **({"sort": sort} if sort else {}),
+    }
+
+
+def model_col(*, min_width: int = 200) -> dict[str, Any]:
+    """Plain monospace model name column (no qualified-model renderer)."""
+    return {
+        "headerName": "Model",
+        "field": "model",
+        "sortable": True,
+        "filter": True,
+        "resizable": True,
+        "flex": 1,
+        "minWidth": min_width,
+        "cellStyle": {"fontFamily": _MONO_FONT},
+    }
+
+
 def qualified_model_col(
     *,
     header: str = "Model",
@@ -83,9 +130,15 @@ def numeric_col(
     header: str,
     field: str,
     width: int,
-    renderer: str = "vdmFormattedNumberRenderer",
+    renderer: str | None = None,
 ) -> dict[str, Any]:
-    return {
+    """Numeric column with thousand separators.
+
+    Formatting uses a valueFormatter by default: AG Grid writes the string straight
+    into the cell, with no React renderer mount per cell. Pass `renderer` only when
+    the cell needs markup.
+    """
+    col: dict[str, Any] = {
         "headerName": header,
         "field": field,
         "sortable": True,
@@ -93,8 +146,12 @@ def numeric_col(
         "resizable": True,
         "width": width,
         "suppressSizeToFit": True,
-        "cellRenderer": renderer,
     }
+    if renderer is not None:
+        col["cellRenderer"] = renderer
+    else:
+        col["valueFormatter"] = {"function": "vdmFormatNumberValue(params.value)"}
+    return col
 
 
 def duration_ms_col(
@@ -10,25 +10,123 @@ tags). The clientside callback below returns minimal configuration since
 dash-ag-grid resolves cell renderers from window.dashAgGridFunctions that
 are registered by the external scripts.
 
+In production the numbered source files can be replaced by a single
+pre-built bundle (see scripts/build_ag_grid_bundle.py): one request and one
+parse in the browser instead of one per file.
+
 Key exports:
 - get_ag_grid_clientside_callback(): maps grid IDs to minimal callback config
+- build_ag_grid_bundle(): writes the single-file bundle from the sources
+- ag_grid_assets_ignore(): Dash `assets_ignore` regex selecting bundle vs sources
 """
 
 from __future__ import annotations
 
+import logging
+import os
+import re
+import shutil
+import subprocess
+from collections.abc import Mapping
+from pathlib import Path
+from types import MappingProxyType
+
+logger = logging.getLogger(__name__)
+
+ASSETS_DIR = Path(__file__).resolve().parents[3] / "assets"
+AG_GRID_BUNDLE_NAME = "vdm-grid.bundle.js"
+
+# Source scripts are served in filename order (10-, 20-, ...), same as Dash does.
+_SOURCE_PATTERN = r"^\d{2}-vdm-[\w-]+\.js$"
+_SOURCE_RE = re.compile(_SOURCE_PATTERN)
+
+# Set to serve the individual source files even when a bundle exists (debugging).
+_JS_SOURCES_ENV = "VDM_DASHBOARD_JS_SOURCES"
+
+
+def ag_grid_source_files(assets_dir: Path = ASSETS_DIR) -> list[Path]:
+    """Return the AG Grid source scripts in load order."""
+    ag_grid_dir = assets_dir / "ag_grid"
+    if not ag_grid_dir.is_dir():
+        return []
+    return sorted(p for p in ag_grid_dir.iterdir() if _SOURCE_RE.match(p.name))
+
+
+def build_ag_grid_bundle(assets_dir: Path = ASSETS_DIR, *, minify: bool = True) -> Path:
+    """Concatenate the AG Grid source scripts into a single bundle file.
+
+    When `minify` is set and `esbuild` is on PATH, the bundle is minified too;
+    otherwise it is a plain concatenation (still one request instead of several).
+
+    Returns:
+        Path of the written bundle.
+    """
+    sources = ag_grid_source_files(assets_dir)
+    # The leading ";" guards against a file that ends without a semicolon.
+    parts = [f";// ---- {p.name} ----\n{p.read_text(encoding='utf-8')}" for p in sources]
+    bundle_text = "\n".join(parts)
+
+    esbuild = shutil.which("esbuild") if minify else None
+    if esbuild:
+        result = subprocess.run(
+            [esbuild, "--minify", "--loader=js"],
+            input=bundle_text,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        bundle_text = result.stdout
+
+    bundle = assets_dir / "ag_grid" / AG_GRID_BUNDLE_NAME
+    bundle.write_text(bundle_text, encoding="utf-8")
+    return bundle
+
+
+def ag_grid_assets_ignore(assets_dir: Path = ASSETS_DIR) -> str:
+    """Return the Dash `assets_ignore` regex for the AG Grid scripts.
+
+    Serves the bundle when it exists and is at least as new as every source
+    file; otherwise (or when VDM_DASHBOARD_JS_SOURCES is set) serves the
+    individual sources so a stale bundle never shadows local edits.
+    """
+    serve_sources = r"^" + re.escape(AG_GRID_BUNDLE_NAME) + r"$"
+    if os.environ.get(_JS_SOURCES_ENV):
+        return serve_sources
+
+    bundle = assets_dir / "ag_grid" / AG_GRID_BUNDLE_NAME
+    sources = ag_grid_source_files(assets_dir)
+    if not bundle.is_file() or not sources:
+        return serve_sources
+    if bundle.stat().st_mtime < max(p.stat().st_mtime for p in sources):
+        logger.info("AG Grid JS bundle is older than its sources; serving sources")
+        return serve_sources
+    return _SOURCE_PATTERN
+
+
+# Grid IDs whose renderers come from the external asset scripts. The keys must
+# match the Dash component id(s) of the AgGrid instances.
+_AG_GRID_IDS = (
+    "vdm-models-grid",
+    "vdm-top-models-grid",
+    "vdm-logs-errors-grid",
+    "vdm-logs-traces-grid",
+)
+
+# One shared read-only payload referenced by every grid entry; built once at import.
+_JS_PAYLOAD: Mapping[str, str] = MappingProxyType({"javascript": ""})
+_CALLBACK_MAP: Mapping[str, Mapping[str, str]] = MappingProxyType(
+    {grid_id: _JS_PAYLOAD for grid_id in _AG_GRID_IDS}
+)
+
 
-def get_ag_grid_clientside_callback() -> dict[str, dict[str, str]]:
+def get_ag_grid_clientside_callback() -> Mapping[str, Mapping[str, str]]:
     """Return the clientside callback configuration for AG-Grid cell renderers.
 
     The JavaScript code is loaded via external script tags in app.py, so this
     returns an empty javascript string. The cell renderers are registered on
     window.dashAgGridFunctions by the external scripts.
 
-    Note: the keys must match the Dash component id(s) of the AgGrid instances.
+    The mapping is built once at import and shared by all callers, so it is
+    returned as a read-only view.
     """
-    return {
-        "vdm-models-grid": {"javascript": ""},
-        "vdm-top-models-grid": {"javascript": ""},
-        "vdm-logs-errors-grid": {"javascript": ""},
-        "vdm-logs-traces-grid": {"javascript": ""},
-    }
+    return _CALLBACK_MAP
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
 import os
+import threading
+import time
 import urllib.parse
-from datetime import UTC
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import UTC, datetime
 from typing import Any
 
 from src.core.alias_config import AliasConfigLoader
 from src.dashboard.components.ui import (
+    format_age,
     format_duration,
-    format_model_created_timestamp,
     format_timestamp,
+    model_created_datetime,
     timestamp_age_seconds,
     timestamp_epoch_ms,
 )
@@ -170,12 +175,19 @@ def format_model_page_url(template: str, model_id: str, display_name: str) -> st
 
 
 def _safe_http_url(value: object) -> str | None:
-    """Return a safe http(s) URL string or None."""
+    """Return a safe http(s) URL string or None.
+
+    Row data is validated once here so the grid renderers can trust URL fields
+    instead of re-parsing them on every cell render.
+    """
     if not isinstance(value, str) or not value:
         return None
 
-    parsed = urllib.parse.urlparse(value)
-    if parsed.scheme not in {"http", "https"}:
+    try:
+        parsed = urllib.parse.urlsplit(value)
+    except ValueError:
+        return None
+    if parsed.scheme not in {"http", "https"} or not parsed.netloc:
         return None
 
     return value
@@ -386,21 +398,38 @@ def metrics_models_row_data(running_totals_yaml: dict[str, Any]) -> list[dict[st
     return row_data
 
 
-def models_row_data(models: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    """Build AG-Grid rowData for the Models page."""
+def models_row_data(
+    models: list[dict[str, Any]],
+    *,
+    default_provider: str | None = None,
+) -> list[dict[str, Any]]:
+    """Build AG-Grid rowData for the Models page.
+
+    Models without a provider are attributed to `default_provider` (or
+    "multiple"); the input dicts are never modified.
+    """
 
     row_data: list[dict[str, Any]] = []
+    # Catalogs repeat a handful of providers; resolve each page template once per call.
+    page_templates: dict[str, str | None] = {}
+    now = datetime.now()
     for model in models:
         created = model.get("created")
         created_value = 0 if created is None else created
         if created_value > 1e12:
             created_value = created_value / 1000
 
-        created_iso = format_model_created_timestamp(created_value)
-        created_relative = format_timestamp(created_iso)
-        created_day = (created_iso or "")[:10]
+        # One datetime for both labels (no ISO format/parse round trip), aged
+        # against a single `now` for the whole call.
+        created_dt = model_created_datetime(created_value)
+        if created_dt is not None:
+            created_day = created_dt.date().isoformat()
+            created_relative = format_age((now - created_dt).total_seconds())
+        else:
+            created_day = ""
+            created_relative = "N/A"
 
-        provider = model.get("provider", "multiple")
+        provider = model.get("provider") or default_provider or "multiple"
         model_id = model.get("id", "")
         display_name = model.get("display_name", model_id)
 
@@ -450,9 +479,14 @@ def models_row_data(models: list[dict[str, Any]]) -> list[dict[str, Any]]:
 
         model_page_url = None
         if model_id:
-            template = get_model_page_template(provider)
+            if provider in page_templates:
+                template = page_templates[provider]
+            else:
+                template = page_templates[provider] = get_model_page_template(provider)
             if template:
-                model_page_url = format_model_page_url(template, model_id, display_name)
+                model_page_url = _safe_http_url(
+                    format_model_page_url(template, model_id, display_name)
+                )
 
         description_full = model.get("description")
         description_text = description_full if isinstance(description_full, str) else None
@@ -484,3 +518,45 @@ def models_row_data(models: list[dict[str, Any]]) -> list[dict[str, Any]]:
         )
 
     return row_data
+
+
+# Memoized row transforms for catalogs that repeat across polls (an unchanged
+# provider catalog). Callers key entries on a digest of the upstream response
+# body, so a lookup never touches the items themselves. Entries expire after
+# ROW_DATA_CACHE_TTL_S so relative labels such as "created_relative" stay
+# roughly current.
+ROW_DATA_CACHE_TTL_S = 300.0
+_ROW_DATA_CACHE_SIZE = 8
+
+_row_data_cache: OrderedDict[tuple[Any, ...], tuple[float, list[dict[str, Any]]]] = OrderedDict()
+_row_data_cache_lock = threading.Lock()
+
+
+def cached_row_data(
+    transform: Callable[..., list[dict[str, Any]]],
+    items: list[dict[str, Any]],
+    *,
+    digest: str,
+    **options: Any,
+) -> list[dict[str, Any]]:
+    """Return `transform(items, **options)`, reusing the rows built for the same `digest`.
+
+    `digest` must identify the content of `items` (e.g. a hash of the response
+    they were parsed from); `options` must be hashable.
+    The returned list is shared between callers and must not be mutated.
+    """
+    key = (transform.__name__, digest, *sorted(options.items()))
+    now = time.monotonic()
+    with _row_data_cache_lock:
+        hit = _row_data_cache.get(key)
+        if hit is not None and now - hit[0] < ROW_DATA_CACHE_TTL_S:
+            _row_data_cache.move_to_end(key)
+            return hit[1]
+
+    rows = transform(items, **options)
+    with _row_data_cache_lock:
+        _row_data_cache[key] = (now, rows)
+        _row_data_cache.move_to_end(key)
+        while len(_row_data_cache) > _ROW_DATA_CACHE_SIZE:
+            _row_data_cache.popitem(last=False)
+    return rows
@@ -2,13 +2,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from pathlib import Path
 from typing import Any
 
 import dash
 import dash_bootstrap_components as dbc  # type: ignore[import-untyped]
 from dash import Input, Output, dcc, html
 
+from src.dashboard.ag_grid.scripts import ASSETS_DIR, ag_grid_assets_ignore
 from src.dashboard.callbacks.aliases import register_aliases_callbacks
 from src.dashboard.callbacks.clientside import register_clientside_callbacks
 from src.dashboard.callbacks.logs import register_logs_callbacks
@@ -23,6 +23,11 @@ from src.dashboard.routing import render_page_for_path
 
 logger = logging.getLogger(__name__)
 
+# Browser cache lifetime for /assets. Script and stylesheet tags carry Dash's
+# ?m=<mtime> fingerprint, so edits still bust the cache; the one-day bound keeps
+# unfingerprinted images (e.g. the navbar logo) from going stale for long.
+_ASSETS_MAX_AGE_S = 24 * 60 * 60
+
 
 def _run(coro: Any) -> Any:
     try:
@@ -42,12 +47,15 @@ def create_dashboard(*, cfg: DashboardConfigProtocol) -> dash.Dash:
     app = dash.Dash(
         __name__,
         requests_pathname_prefix="/dashboard/",
-        assets_folder=str(Path(__file__).resolve().parents[2] / "assets"),
+        assets_folder=str(ASSETS_DIR),
         assets_url_path="assets",
+        assets_ignore=ag_grid_assets_ignore(ASSETS_DIR),
         external_stylesheets=[dbc.themes.DARKLY],
         suppress_callback_exceptions=True,
         title="Vandamme Dashboard",
     )
+    # Let browsers cache the AG Grid scripts instead of revalidating on every page load.
+    app.server.config["SEND_FILE_MAX_AGE_DEFAULT"] = _ASSETS_MAX_AGE_S
 
     app.layout = html.Div(
         [
@@ -6,6 +6,8 @@ import dash
 from dash import Input, Output, State
 
 from src.dashboard.data_sources import DashboardConfigProtocol
+from src.dashboard.fingerprint import fingerprint
+from src.dashboard.services.metrics import get_metrics_view
 
 
 def register_metrics_callbacks(
@@ -19,33 +21,59 @@ def register_metrics_callbacks(
         Output("vdm-active-requests", "children"),
         Output("vdm-provider-breakdown", "children"),
         Output("vdm-model-breakdown", "children"),
+        Output("vdm-metrics-view-fingerprints", "data"),
         Input("vdm-metrics-poll", "n_intervals"),
         Input("vdm-metrics-refresh", "n_clicks"),
         State("vdm-metrics-poll-toggle", "value"),
+        State("vdm-metrics-view-fingerprints", "data"),
         prevent_initial_call=False,
     )
     def refresh_metrics(
         n: int,
         refresh_clicks: int | None,
         polling: bool,
-    ) -> tuple[Any, Any, Any, Any]:
+        previous: list[str] | None,
+    ) -> tuple[Any, Any, Any, Any, list[str]]:
         # Manual refresh should always work. Polling can be disabled.
         if not refresh_clicks and (not polling) and n:
             raise dash.exceptions.PreventUpdate
 
-        from src.dashboard.services.metrics import build_metrics_view
-
-        view = run(build_metrics_view(cfg=cfg))
-        return (
+        manual_refresh = dash.callback_context.triggered_id == "vdm-metrics-refresh"
+        view = get_metrics_view(cfg=cfg, run=run, force=manual_refresh)
+        outputs = (
             view.token_chart,
             view.active_requests,
             view.provider_breakdown,
             view.model_breakdown,
         )
 
-    @app.callback(Output("vdm-metrics-poll", "interval"), Input("vdm-metrics-interval", "value"))
-    def set_metrics_interval(ms: int) -> int:
-        return ms
+        # Fingerprints live in a per-browser Store, so each tab only skips outputs
+        # it already rendered. Unchanged fragments are not re-sent or re-mounted.
+        fingerprints = [fingerprint(output) for output in outputs]
+        if not previous or len(previous) != len(fingerprints):
+            previous = [""] * len(fingerprints)
+        token_chart, active_requests, provider_breakdown, model_breakdown = (
+            dash.no_update if fp == prev else output
+            for output, fp, prev in zip(outputs, fingerprints, previous, strict=True)
+        )
+        return (
+            token_chart,
+            active_requests,
+            provider_breakdown,
+            model_breakdown,
+            fingerprints,
+        )
+
+    app.clientside_callback(
+        """
+        function(ms) {
+            // Pure pass-through: no need for a server round trip.
+            return ms;
+        }
+        """,
+        Output("vdm-metrics-poll", "interval"),
+        Input("vdm-metrics-interval", "value"),
+    )
 
     app.clientside_callback(
         """
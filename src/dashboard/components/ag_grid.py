@@ -1,5 +1,6 @@
 """AG-Grid component for the dashboard with dark theme support."""
 
+from collections.abc import Mapping
 from typing import Any
 
 import dash_ag_grid as dag  # type: ignore[import-untyped]
@@ -8,9 +9,12 @@ from src.dashboard.ag_grid.column_presets import (
     duration_like_last_col,
     duration_ms_col,
     last_col,
+    model_col,
     numeric_col,
+    provider_badge_col,
     qualified_model_col,
     resolved_model_col,
+    time_col,
 )
 from src.dashboard.ag_grid.factories import build_ag_grid
 from src.dashboard.ag_grid.grid_presets import grid_css_compact, metrics_common_grid_options
@@ -104,6 +108,76 @@ def metrics_active_requests_component(active_requests_payload: dict[str, Any]) -
     return metrics_active_requests_ag_grid(active_requests_payload)
 
 
+# Column definitions for the grids below are static: built once at import and
+# passed to build_ag_grid by reference on every render, so never mutate them.
+_TOP_MODELS_COLUMN_DEFS: list[dict[str, Any]] = [
+    {
+        "headerName": "Provider",
+        "field": "provider",
+        "sortable": True,
+        "filter": True,
+        "resizable": True,
+        "width": 130,
+        "suppressSizeToFit": True,
+    },
+    {
+        "headerName": "Sub-provider",
+        "field": "sub_provider",
+        "sortable": True,
+        "filter": True,
+        "resizable": True,
+        "width": 160,
+        "suppressSizeToFit": True,
+    },
+    {
+        "headerName": "Model ID",
+        "field": "id",
+        "sortable": True,
+        "filter": True,
+        "resizable": True,
+        "flex": 2,
+        "minWidth": 260,
+        "cellStyle": {"cursor": "copy"},
+    },
+    {
+        "headerName": "Name",
+        "field": "name",
+        "sortable": True,
+        "filter": True,
+        "resizable": True,
+        "flex": 1,
+        "minWidth": 160,
+    },
+    {
+        "headerName": "Context",
+        "field": "context_window",
+        "sortable": True,
+        "filter": True,
+        "resizable": True,
+        "width": 120,
+        "suppressSizeToFit": True,
+    },
+    {
+        "headerName": "Avg $/M",
+        "field": "avg_per_million",
+        "sortable": True,
+        "filter": True,
+        "resizable": True,
+        "width": 120,
+        "suppressSizeToFit": True,
+    },
+    {
+        "headerName": "Caps",
+        "field": "capabilities",
+        "sortable": False,
+        "filter": True,
+        "resizable": True,
+        "flex": 1,
+        "minWidth": 220,
+    },
+]
+
+
 def top_models_ag_grid(
     models: list[dict[str, Any]],
     *,
@@ -113,76 +187,9 @@ def top_models_ag_grid(
 
     Expects rows shaped like the `/top-models` API output items.
     """
-    column_defs = [
-        {
-            "headerName": "Provider",
-            "field": "provider",
-            "sortable": True,
-            "filter": True,
-            "resizable": True,
-            "width": 130,
-            "suppressSizeToFit": True,
-        },
-        {
-            "headerName": "Sub-provider",
-            "field": "sub_provider",
-            "sortable": True,
-            "filter": True,
-            "resizable": True,
-            "width": 160,
-            "suppressSizeToFit": True,
-        },
-        {
-            "headerName": "Model ID",
-            "field": "id",
-            "sortable": True,
-            "filter": True,
-            "resizable": True,
-            "flex": 2,
-            "minWidth": 260,
-            "cellStyle": {"cursor": "copy"},
-        },
-        {
-            "headerName": "Name",
-            "field": "name",
-            "sortable": True,
-            "filter": True,
-            "resizable": True,
-            "flex": 1,
-            "minWidth": 160,
-        },
-        {
-            "headerName": "Context",
-            "field": "context_window",
-            "sortable": True,
-            "filter": True,
-            "resizable": True,
-            "width": 120,
-            "suppressSizeToFit": True,
-        },
-        {
-            "headerName": "Avg $/M",
-            "field": "avg_per_million",
-            "sortable": True,
-            "filter": True,
-            "resizable": True,
-            "width": 120,
-            "suppressSizeToFit": True,
-        },
-        {
-            "headerName": "Caps",
-            "field": "capabilities",
-            "sortable": False,
-            "filter": True,
-            "resizable": True,
-            "flex": 1,
-            "minWidth": 220,
-        },
-    ]
-
     return build_ag_grid(
         grid_id=grid_id,
-        column_defs=column_defs,
+        column_defs=_TOP_MODELS_COLUMN_DEFS,
         row_data=top_models_row_data(models),
         no_rows_message="No models found",
     )
@@ -191,6 +198,116 @@ def top_models_ag_grid(
 # --- Models AG Grid ---
 
 
+# Column order: Created → Actions → Model ID → metadata
+_MODELS_COLUMN_DEFS: list[dict[str, Any]] = [
+    {
+        "headerName": "Created",
+        # Sort on the raw epoch seconds (plain numeric compare, no date parsing);
+        # display and filter on the yyyy-mm-dd day string.
+        "field": "created",
+        "valueFormatter": {"function": "params.data.created_iso"},
+        "filterValueGetter": {"function": "params.data.created_iso"},
+        "sortable": True,
+        "filter": True,
+        "resizable": True,
+        "width": 120,  # Fixed width for yyyy-mm-dd format (plus padding)
+        "suppressSizeToFit": True,
+        "suppressMovable": False,
+        "sort": "desc",  # Default sort by creation date (newest first)
+        "tooltipField": "created_relative",
+    },
+    {
+        "headerName": "Actions",
+        "field": "actions",
+        "sortable": False,
+        "filter": False,
+        "resizable": False,
+        "width": 80,  # Fixed width for emoji icon with padding
+        "suppressSizeToFit": True,
+        "suppressMovable": True,
+        "cellRenderer": "vdmModelPageLinkRenderer",
+    },
+    {
+        "headerName": "Sub-Provider",
+        "field": "owned_by",
+        "sortable": True,
+        "filter": True,
+        "resizable": True,
+        "flex": 1,
+        "minWidth": 140,
+    },
+    {
+        "headerName": "Model ID",
+        "field": "id",
+        "sortable": True,
+        "filter": True,
+        "resizable": True,
+        "flex": 2,
+        "minWidth": 220,
+        "suppressMovable": False,
+        "cellStyle": {"cursor": "copy"},
+        "tooltipField": "description_full",
+        # Render as: icon + id (cell click-to-copy is attached by JS listener)
+        "cellRenderer": "vdmModelIdWithIconRenderer",
+    },
+    {
+        "headerName": "Modality",
+        "field": "architecture_modality",
+        "sortable": True,
+        "filter": True,
+        "resizable": True,
+        "flex": 1,
+        "minWidth": 170,
+    },
+    {
+        "headerName": "Context",
+        "field": "context_length",
+        "sortable": True,
+        "filter": True,
+        "resizable": True,
+        "width": 110,
+        "suppressSizeToFit": True,
+    },
+    {
+        "headerName": "Max out",
+        "field": "max_output_tokens",
+        "sortable": True,
+        "filter": True,
+        "resizable": True,
+        "width": 110,
+        "suppressSizeToFit": True,
+    },
+    {
+        "headerName": "$/M in",
+        "field": "pricing_prompt_per_million",
+        "sortable": True,
+        "filter": True,
+        "resizable": True,
+        "width": 100,
+        "suppressSizeToFit": True,
+    },
+    {
+        "headerName": "$/M out",
+        "field": "pricing_completion_per_million",
+        "sortable": True,
+        "filter": True,
+        "resizable": True,
+        "width": 100,
+        "suppressSizeToFit": True,
+    },
+    {
+        "headerName": "Description",
+        "field": "description_preview",
+        "sortable": True,
+        "filter": True,
+        "resizable": True,
+        "flex": 3,
+        "minWidth": 360,
+        "tooltipField": "description_full",
+    },
+]
+
+
 def models_ag_grid(
     models: list[dict[str, Any]],
     grid_id: str = "vdm-models-grid",
@@ -206,123 +323,47 @@ def models_ag_grid(
     """
     row_data = models_row_data(models)
 
-    # Define column definitions with new order: Created → Actions → Model ID → metadata
-    column_defs = [
-        {
-            "headerName": "Created",
-            "field": "created_iso",
-            "sortable": True,
-            "filter": True,
-            "resizable": True,
-            "width": 120,  # Fixed width for yyyy-mm-dd format (plus padding)
-            "suppressSizeToFit": True,
-            "suppressMovable": False,
-            "sort": "desc",  # Default sort by creation date (newest first)
-            "tooltipField": "created_relative",
-            "comparator": {"function": "vdmDateComparator"},
-        },
-        {
-            "headerName": "Actions",
-            "field": "actions",
-            "sortable": False,
-            "filter": False,
-            "resizable": False,
-            "width": 80,  # Fixed width for emoji icon with padding
-            "suppressSizeToFit": True,
-            "suppressMovable": True,
-            "cellRenderer": "vdmModelPageLinkRenderer",
-        },
-        {
-            "headerName": "Sub-Provider",
-            "field": "owned_by",
-            "sortable": True,
-            "filter": True,
-            "resizable": True,
-            "flex": 1,
-            "minWidth": 140,
-        },
-        {
-            "headerName": "Model ID",
-            "field": "id",
-            "sortable": True,
-            "filter": True,
-            "resizable": True,
-            "flex": 2,
-            "minWidth": 220,
-            "suppressMovable": False,
-            "cellStyle": {"cursor": "copy"},
-            "tooltipField": "description_full",
-            # Render as: icon + id (cell click-to-copy is attached by JS listener)
-            "cellRenderer": "vdmModelIdWithIconRenderer",
-        },
-        {
-            "headerName": "Modality",
-            "field": "architecture_modality",
-            "sortable": True,
-            "filter": True,
-            "resizable": True,
-            "flex": 1,
-            "minWidth": 170,
-        },
-        {
-            "headerName": "Context",
-            "field": "context_length",
-            "sortable": True,
-            "filter": True,
-            "resizable": True,
-            "width": 110,
-            "suppressSizeToFit": True,
-        },
-        {
-            "headerName": "Max out",
-            "field": "max_output_tokens",
-            "sortable": True,
-            "filter": True,
-            "resizable": True,
-            "width": 110,
-            "suppressSizeToFit": True,
-        },
-        {
-            "headerName": "$/M in",
-            "field": "pricing_prompt_per_million",
-            "sortable": True,
-            "filter": True,
-            "resizable": True,
-            "width": 100,
-            "suppressSizeToFit": True,
-        },
-        {
-            "headerName": "$/M out",
-            "field": "pricing_completion_per_million",
-            "sortable": True,
-            "filter": True,
-            "resizable": True,
-            "width": 100,
-            "suppressSizeToFit": True,
-        },
-        {
-            "headerName": "Description",
-            "field": "description_preview",
-            "sortable": True,
-            "filter": True,
-            "resizable": True,
-            "flex": 3,
-            "minWidth": 360,
-            "tooltipField": "description_full",
-        },
-    ]
-
     return build_ag_grid(
         grid_id=grid_id,
-        column_defs=column_defs,
+        column_defs=_MODELS_COLUMN_DEFS,
         row_data=row_data,
         no_rows_message="No models found",
         dash_grid_options_overrides={
             "rowSelection": {"enableClickSelection": True},
+            # Stable row ids let a rowData update reuse the existing row nodes
+            # (only changed rows re-render; selection and page are kept).
+            "getRowId": {"function": "params.data.provider + '/' + params.data.id"},
         },
     )
 
 
+_LOGS_ERRORS_COLUMN_DEFS: list[dict[str, Any]] = [
+    time_col(sort="desc"),  # Default sort by time (newest first)
+    provider_badge_col(),
+    model_col(),
+    {
+        "headerName": "Error Type",
+        "field": "error_type",
+        "sortable": True,
+        "filter": True,
+        "resizable": True,
+        "width": 160,
+        "suppressSizeToFit": True,
+    },
+    {
+        "headerName": "Error Message",
+        "field": "error",
+        "sortable": True,
+        "filter": True,
+        "resizable": True,
+        "flex": 3,
+        "minWidth": 300,
+        "cellStyle": {"fontFamily": "ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas"},
+        "tooltipField": "error",
+    },
+]
+
+
 def logs_errors_ag_grid(
     errors: list[dict[str, Any]],
     grid_id: str = "vdm-logs-errors-grid",
@@ -338,69 +379,45 @@ def logs_errors_ag_grid(
     """
     row_data = logs_errors_row_data(errors)
 
-    # Define column definitions for errors
-    column_defs = [
-        {
-            "headerName": "Time",
-            "field": "time_formatted",
-            "sortable": True,
-            "filter": True,
-            "resizable": True,
-            "width": 100,
-            "suppressSizeToFit": True,
-            "tooltipField": "time_relative",
-            "sort": "desc",  # Default sort by time (newest first)
-        },
-        {
-            "headerName": "Provider",
-            "field": "provider",
-            "sortable": True,
-            "filter": True,
-            "resizable": True,
-            "width": 130,
-            "suppressSizeToFit": True,
-            "cellRenderer": "vdmProviderBadgeRenderer",
-        },
-        {
-            "headerName": "Model",
-            "field": "model",
-            "sortable": True,
-            "filter": True,
-            "resizable": True,
-            "flex": 1,
-            "minWidth": 200,
-            "cellStyle": {"fontFamily": "ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas"},
-        },
-        {
-            "headerName": "Error Type",
-            "field": "error_type",
-            "sortable": True,
-            "filter": True,
-            "resizable": True,
-            "width": 160,
-            "suppressSizeToFit": True,
-        },
-        {
-            "headerName": "Error Message",
-            "field": "error",
-            "sortable": True,
-            "filter": True,
-            "resizable": True,
-            "flex": 3,
-            "minWidth": 300,
-            "cellStyle": {"fontFamily": "ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas"},
-            "tooltipField": "error",
-        },
-    ]
-
     return build_ag_grid(
         grid_id=grid_id,
-        column_defs=column_defs,
+        column_defs=_LOGS_ERRORS_COLUMN_DEFS,
         row_data=row_data,
         no_rows_message="No errors found",
     )
 
 
+_LOGS_TRACES_COLUMN_DEFS: list[dict[str, Any]] = [
+    time_col(sort="desc"),  # Default sort by time (newest first)
+    provider_badge_col(),
+    model_col(),
+    {
+        "headerName": "Status",
+        "field": "status",
+        "sortable": True,
+        "filter": True,
+        "resizable": True,
+        "width": 100,
+        "suppressSizeToFit": True,
+    },
+    {
+        "headerName": "Duration",
+        "field": "duration_formatted",
+        "sortable": True,
+        "filter": True,
+        "resizable": True,
+        "width": 100,
+        "suppressSizeToFit": True,
+        "tooltipField": "duration_ms",
+        "comparator": {"function": "vdmNumericComparator"},
+    },
+    numeric_col(header="In Tokens", field="input_tokens_raw", width=110),
+    numeric_col(header="Out Tokens", field="output_tokens_raw", width=110),
+    numeric_col(header="Cache Read", field="cache_read_tokens_raw", width=110),
+    numeric_col(header="Cache Create", field="cache_creation_tokens_raw", width=110),
+]
+
+
 def logs_traces_ag_grid(
     traces: list[dict[str, Any]],
     grid_id: str = "vdm-logs-traces-grid",
@@ -416,104 +433,9 @@ def logs_traces_ag_grid(
     """
     row_data = logs_traces_row_data(traces)
 
-    # Define column definitions for traces
-    column_defs = [
-        {
-            "headerName": "Time",
-            "field": "time_formatted",
-            "sortable": True,
-            "filter": True,
-            "resizable": True,
-            "width": 100,
-            "suppressSizeToFit": True,
-            "tooltipField": "time_relative",
-            "sort": "desc",  # Default sort by time (newest first)
-        },
-        {
-            "headerName": "Provider",
-            "field": "provider",
-            "sortable": True,
-            "filter": True,
-            "resizable": True,
-            "width": 130,
-            "suppressSizeToFit": True,
-            "cellRenderer": "vdmProviderBadgeRenderer",
-        },
-        {
-            "headerName": "Model",
-            "field": "model",
-            "sortable": True,
-            "filter": True,
-            "resizable": True,
-            "flex": 1,
-            "minWidth": 200,
-            "cellStyle": {"fontFamily": "ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas"},
-        },
-        {
-            "headerName": "Status",
-            "field": "status",
-            "sortable": True,
-            "filter": True,
-            "resizable": True,
-            "width": 100,
-            "suppressSizeToFit": True,
-        },
-        {
-            "headerName": "Duration",
-            "field": "duration_formatted",
-            "sortable": True,
-            "filter": True,
-            "resizable": True,
-            "width": 100,
-            "suppressSizeToFit": True,
-            "tooltipField": "duration_ms",
-            "comparator": {"function": "vdmNumericComparator"},
-        },
-        {
-            "headerName": "In Tokens",
-            "field": "input_tokens_raw",
-            "sortable": True,
-            "filter": True,
-            "resizable": True,
-            "width": 110,
-            "suppressSizeToFit": True,
-            "cellRenderer": "vdmFormattedNumberRenderer",
-        },
-        {
-            "headerName": "Out Tokens",
-            "field": "output_tokens_raw",
-            "sortable": True,
-            "filter": True,
-            "resizable": True,
-            "width": 110,
-            "suppressSizeToFit": True,
-            "cellRenderer": "vdmFormattedNumberRenderer",
-        },
-        {
-            "headerName": "Cache Read",
-            "field": "cache_read_tokens_raw",
-            "sortable": True,
-            "filter": True,
-            "resizable": True,
-            "width": 110,
-            "suppressSizeToFit": True,
-            "cellRenderer": "vdmFormattedNumberRenderer",
-        },
-        {
-            "headerName": "Cache Create",
-            "field": "cache_creation_tokens_raw",
-            "sortable": True,
-            "filter": True,
-            "resizable": True,
-            "width": 110,
-            "suppressSizeToFit": True,
-            "cellRenderer": "vdmFormattedNumberRenderer",
-        },
-    ]
-
     return build_ag_grid(
         grid_id=grid_id,
-        column_defs=column_defs,
+        column_defs=_LOGS_TRACES_COLUMN_DEFS,
         row_data=row_data,
         no_rows_message="No traces found",
     )
@@ -528,17 +450,7 @@ def metrics_providers_ag_grid(
 
     column_defs = [
         last_col(),
-        {
-            "headerName": "Provider",
-            "field": "provider",
-            "sortable": True,
-            "filter": True,
-            "resizable": True,
-            "width": 160,
-            "suppressSizeToFit": True,
-            "cellRenderer": "vdmProviderBadgeRenderer",
-            "sort": "asc",
-        },
+        provider_badge_col(width=160, sort="asc"),
         {
             "headerName": "Avg",
             "field": "average_duration_ms",
@@ -626,7 +538,7 @@ def metrics_models_ag_grid(
     )
 
 
-def get_ag_grid_clientside_callback() -> dict[str, dict[str, str]]:
+def get_ag_grid_clientside_callback() -> Mapping[str, Mapping[str, str]]:
     """Return the clientside callback for AG-Grid cell renderers.
 
     Note: the keys must match the Dash component id(s) of the AgGrid instances.
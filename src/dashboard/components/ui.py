@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Any
 
 import dash_ag_grid as dag  # type: ignore[import-untyped]
@@ -8,8 +9,8 @@ import dash_bootstrap_components as dbc  # type: ignore[import-untyped]
 from dash import html
 
 
-def format_model_created_timestamp(timestamp: int | float | None) -> str | None:
-    """Safely format model creation timestamp to ISO format.
+def model_created_datetime(timestamp: int | float | None) -> datetime | None:
+    """Safely convert a model creation timestamp to a naive local datetime.
 
     Handles large timestamps that might cause 'year out of range' errors.
     """
@@ -24,11 +25,17 @@ def format_model_created_timestamp(timestamp: int | float | None) -> str | None:
         if not (-62135596800 <= ts <= 253402300799):
             return None
 
-        return datetime.fromtimestamp(ts).isoformat()
+        return datetime.fromtimestamp(ts)
     except (ValueError, OSError, OverflowError):
         return None
 
 
+def format_model_created_timestamp(timestamp: int | float | None) -> str | None:
+    """Safely format model creation timestamp to ISO format."""
+    dt = model_created_datetime(timestamp)
+    return dt.isoformat() if dt is not None else None
+
+
 def monospace(text: Any) -> html.Span:
     """Apply monospace font to text or span with style preservation."""
     if isinstance(text, html.Span):
@@ -105,58 +112,36 @@ def format_duration(ms: float) -> str:
     return f"{days}d {hours:02d}h" if hours else f"{days}d"
 
 
+def format_age(seconds: float) -> str:
+    """Format an age in seconds as relative time ("5m ago"); negative is "Just now"."""
+    # Handle future timestamps (clock skew)
+    if seconds < 0:
+        return "Just now"
+
+    if seconds < 60:
+        return f"{int(seconds)}s ago"
+    elif seconds < 3600:
+        return f"{int(seconds / 60)}m ago"
+    elif seconds < 86400:
+        return f"{int(seconds / 3600)}h ago"
+    else:
+        return f"{int(seconds / 86400)}d ago"
+
+
 def format_timestamp(iso_string: str | None) -> str:
     """Convert ISO timestamp to relative time format with enhanced parsing."""
     if not iso_string:
         return "N/A"
 
     try:
-        # Handle various ISO timestamp formats
-        # Format with Z suffix
-        if iso_string.endswith("Z"):
-            dt = datetime.fromisoformat(iso_string.replace("Z", "+00:00"))
-        # Format with timezone offset
-        elif "+" in iso_string[-6:] or "-" in iso_string[-6:]:
-            dt = datetime.fromisoformat(iso_string)
-        # Format without timezone info (assume local time)
-        else:
-            # Parse naive datetime and treat it as local time
-            dt = datetime.fromisoformat(iso_string)
-            now = datetime.now()
-            # Compare naive datetimes in local time
-            diff = now - dt
-
-            # Handle future timestamps (clock skew)
-            if diff.total_seconds() < 0:
-                return "Just now"
-
-            # Format as relative time
-            if diff.total_seconds() < 60:
-                return f"{int(diff.total_seconds())}s ago"
-            elif diff.total_seconds() < 3600:
-                return f"{int(diff.total_seconds() / 60)}m ago"
-            elif diff.total_seconds() < 86400:
-                return f"{int(diff.total_seconds() / 3600)}h ago"
-            else:
-                return f"{int(diff.total_seconds() / 86400)}d ago"
+        # fromisoformat (3.11+) accepts both "Z" and "+HH:MM" offsets.
+        dt = datetime.fromisoformat(iso_string)
+        if dt.tzinfo is None:
+            # No timezone info: treat as local time
+            return format_age((datetime.now() - dt).total_seconds())
 
         # For timezone-aware timestamps, use UTC comparison
-        now = datetime.now(UTC)
-        diff = now - dt
-
-        # Handle future timestamps (clock skew)
-        if diff.total_seconds() < 0:
-            return "Just now"
-
-        # Format as relative time
-        if diff.total_seconds() < 60:
-            return f"{int(diff.total_seconds())}s ago"
-        elif diff.total_seconds() < 3600:
-            return f"{int(diff.total_seconds() / 60)}m ago"
-        elif diff.total_seconds() < 86400:
-            return f"{int(diff.total_seconds() / 3600)}h ago"
-        else:
-            return f"{int(diff.total_seconds() / 86400)}d ago"
+        return format_age((datetime.now(UTC) - dt).total_seconds())
     except (ValueError, TypeError, AttributeError):
         return "Unknown"
 
@@ -166,11 +151,7 @@ def _parse_iso_datetime(iso_string: str | None) -> datetime | None:
         return None
 
     try:
-        if iso_string.endswith("Z"):
-            return datetime.fromisoformat(iso_string.replace("Z", "+00:00"))
-        if "+" in iso_string[-6:] or "-" in iso_string[-6:]:
-            return datetime.fromisoformat(iso_string)
-        # Naive datetime: treat as local time
+        # Handles "Z" and offsets; naive datetimes are treated as local time.
         return datetime.fromisoformat(iso_string)
     except (ValueError, TypeError, AttributeError):
         return None
@@ -377,12 +358,16 @@ def search_box(id: str, placeholder: str = "Search...", debounce: bool = True) -
     )
 
 
+@lru_cache(maxsize=128)
 def provider_badge(provider: str, color: str | None = None) -> dbc.Badge:
     """Create a styled provider badge.
 
     Rules:
     - Some well-known providers have fixed colors for consistent branding.
     - All other providers get a deterministic color derived from their name.
+
+    The same few providers repeat on every poll, so badges are memoized; the
+    returned component is shared and must not be mutated by callers.
     """
 
     p = (provider or "").strip()
@@ -470,20 +455,134 @@ def model_details_modal() -> dbc.Modal:
     )
 
 
+# Models detail drawer tables: (section title, ((row label, field key), ...)).
+# Each value cell is laid out once with id `vdm-model-details-field-<key>` and
+# filled in by render_model_details (assets/ag_grid/40-vdm-model-details.js),
+# which returns the cell values in MODEL_DETAIL_FIELD_KEYS order.
+MODEL_DETAIL_SECTIONS: tuple[tuple[str, tuple[tuple[str, str], ...]], ...] = (
+    (
+        "Overview",
+        (
+            ("Model", "model"),
+            ("Provider", "provider"),
+            ("Sub-provider", "owned_by"),
+            ("Modality", "modality"),
+            ("Created", "created"),
+        ),
+    ),
+    ("Context", (("Context length", "context_length"), ("Max output", "max_output_tokens"))),
+    ("Pricing", (("$/M input", "pricing_in"), ("$/M output", "pricing_out"))),
+)
+
+MODEL_DETAIL_FIELD_KEYS: tuple[str, ...] = tuple(
+    key for _, rows in MODEL_DETAIL_SECTIONS for _, key in rows
+)
+
+
+def model_detail_field_id(key: str) -> str:
+    """Component id of the drawer value cell for a MODEL_DETAIL_SECTIONS field key."""
+    return f"vdm-model-details-field-{key}"
+
+
+# Styling shared by every drawer detail table.
+_MODEL_DETAIL_TABLE_PROPS: dict[str, Any] = {
+    "bordered": False,
+    "striped": True,
+    "size": "sm",
+    "className": "table-dark mt-2",
+}
+
+
+def _model_detail_table(rows: tuple[tuple[str, str], ...]) -> dbc.Table:
+    return dbc.Table(
+        html.Tbody(
+            [
+                html.Tr(
+                    [
+                        html.Td(label, className="text-muted"),
+                        html.Td("—", id=model_detail_field_id(key)),
+                    ]
+                )
+                for label, key in rows
+            ]
+        ),
+        **_MODEL_DETAIL_TABLE_PROPS,
+    )
+
+
 def model_details_drawer() -> dbc.Offcanvas:
     """Right-side drawer for displaying model details.
 
     The models grid supports multi-select (for copy IDs). The drawer is intended to
     show details for the *focused* row (typically the first selected row).
 
+    The drawer structure is static; a row click only replaces the contents of the
+    individual slots below instead of re-rendering the whole drawer.
+
     Callback outputs:
-    - Body: #vdm-model-details-body
+    - Header: #vdm-model-details-icon, #vdm-model-details-title,
+      #vdm-model-details-page-link
+    - Body: one cell per MODEL_DETAIL_FIELD_KEYS (see model_detail_field_id),
+      #vdm-model-details-description, #vdm-model-details-raw-json
     - Open state: #vdm-model-details-drawer.is_open
     """
+    body: list[Any] = []
+    for title, rows in MODEL_DETAIL_SECTIONS:
+        body += [
+            html.Div(title, className="text-muted small"),
+            _model_detail_table(rows),
+            html.Hr(),
+        ]
+    body += [
+        html.Div("Description", className="text-muted small"),
+        html.Div(
+            "—",
+            id="vdm-model-details-description",
+            className="mt-2",
+            style={"whiteSpace": "pre-wrap"},
+        ),
+        html.Hr(),
+        html.Details(
+            [
+                html.Summary("Raw JSON", style={"cursor": "pointer"}, className="text-muted small"),
+                html.Pre(
+                    id="vdm-model-details-raw-json",
+                    className="mt-2",
+                    style={
+                        "whiteSpace": "pre-wrap",
+                        "fontFamily": "ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas",
+                        "fontSize": "0.8rem",
+                        "maxHeight": "40vh",
+                        "overflow": "auto",
+                        "backgroundColor": "rgba(255,255,255,0.06)",
+                        "padding": "10px",
+                        "borderRadius": "6px",
+                    },
+                ),
+            ],
+            className="mt-2",
+        ),
+    ]
+
     return dbc.Offcanvas(
         [
-            html.Div(id="vdm-model-details-header"),
-            html.Div(id="vdm-model-details-body"),
+            html.Div(
+                dbc.Row(
+                    [
+                        dbc.Col(id="vdm-model-details-icon", width="auto"),
+                        dbc.Col(id="vdm-model-details-title", width=True),
+                        dbc.Col(id="vdm-model-details-page-link", width="auto"),
+                    ],
+                    align="center",
+                    className="mb-3",
+                ),
+                id="vdm-model-details-header",
+                className="mb-3",
+            ),
+            html.Div(
+                dbc.Card(dbc.CardBody(body), className="bg-dark text-white"),
+                id="vdm-model-details-body",
+            ),
             dbc.Button(
                 "Close",
                 id="vdm-model-details-close",
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 from dataclasses import dataclass
 from typing import Any, Protocol
@@ -7,6 +8,13 @@ from typing import Any, Protocol
 import httpx
 import yaml
 
+# orjson parses the (large) /v1/models payload several times faster than the
+# stdlib; optional, falls back to httpx's json decoding.
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 # PyYAML is untyped; we rely on types-PyYAML in dev.
@@ -22,7 +30,26 @@ class DashboardConfig(DashboardConfigProtocol):
 
 
 class DashboardDataError(RuntimeError):
-    pass
+    """A dashboard API fetch failed.
+
+    ``error_type`` is set when the raise site already knows the failure
+    category (see services.models._classify_error for the values).
+    """
+
+    def __init__(self, message: str, *, error_type: str | None = None) -> None:
+        super().__init__(message)
+        self.error_type = error_type
+
+
+# Models-fetch error categories by HTTP status; other statuses stay unclassified.
+_STATUS_ERROR_TYPES: dict[int, str] = {
+    401: "auth",
+    403: "auth",
+    404: "not_found",
+    500: "server_error",
+    502: "server_error",
+    503: "server_error",
+}
 
 
 def _log_and_raise(msg: str, url: str, exc: Exception) -> None:
@@ -30,6 +57,13 @@ def _log_and_raise(msg: str, url: str, exc: Exception) -> None:
     raise DashboardDataError(f"{msg} from {url}: {exc}") from exc
 
 
+def _response_json(resp: httpx.Response) -> Any:
+    """Decode a JSON response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+
 async def fetch_health(*, cfg: DashboardConfigProtocol) -> dict[str, Any]:
     url = f"{cfg.api_base_url}/health"
     async with httpx.AsyncClient(timeout=10) as client:
@@ -121,6 +155,18 @@ async def fetch_models(
 
     Preserves provider context in error messages for elegant display.
     """
+    payload, _digest = await fetch_models_with_digest(cfg=cfg, provider=provider)
+    return payload
+
+
+async def fetch_models_with_digest(
+    *, cfg: DashboardConfigProtocol, provider: str | None = None
+) -> tuple[dict[str, Any], str]:
+    """Like fetch_models, also returning a digest of the raw response body.
+
+    The digest identifies an unchanged catalog across polls without
+    re-serializing the parsed payload (see ag_grid.cached_row_data).
+    """
     url = f"{cfg.api_base_url}/v1/models"
     params: dict[str, str] = {"format": "openai"}
     headers: dict[str, str] = {}
@@ -136,30 +182,35 @@ async def fetch_models(
     except httpx.TimeoutException as e:
         raise DashboardDataError(
             f"Timeout fetching models for provider {provider_display}: {type(e).__name__}",
+            error_type="timeout",
         ) from e
     except httpx.NetworkError as e:
         raise DashboardDataError(
             f"Connection error fetching models for provider {provider_display}: {type(e).__name__}",
+            error_type="connection",
         ) from e
     except httpx.HTTPStatusError as e:
         raise DashboardDataError(
             f"HTTP error fetching models for provider {provider_display}: {e.response.status_code}",
+            error_type=_STATUS_ERROR_TYPES.get(e.response.status_code),
         ) from e
 
     if resp.status_code != 200:
         raise DashboardDataError(
             f"Failed to fetch models for provider {provider_display}: HTTP {resp.status_code}",
+            error_type=_STATUS_ERROR_TYPES.get(resp.status_code),
         )
 
     try:
-        data = resp.json()
+        data = _response_json(resp)
     except Exception as e:  # noqa: BLE001
         _log_and_raise("Failed to parse JSON", url, e)
+    digest = hashlib.blake2b(resp.content, digest_size=8).hexdigest()
 
     if isinstance(data, dict):
         list_data = data.get("data")
         if isinstance(list_data, list):
-            return data
+            return data, digest
 
         alt_list = data.get("models")
         if isinstance(alt_list, list):
@@ -171,7 +222,7 @@ async def fetch_models(
                 " ".join(message_parts),
                 extra={"provider": provider or "", "count": len(alt_list)},
             )
-            return {"object": "list", "data": alt_list}
+            return {"object": "list", "data": alt_list}, digest
 
         raise DashboardDataError(
             f"Unexpected /v1/models JSON shape from {url}: missing 'data' list"
@@ -182,7 +233,7 @@ async def fetch_models(
             "dashboard.models: /v1/models returned bare list; wrapping",
             extra={"provider": provider or "", "count": len(data)},
         )
-        return {"object": "list", "data": data}
+        return {"object": "list", "data": data}, digest
 
     raise DashboardDataError(f"Unexpected /v1/models JSON shape from {url}: {type(data)}")
 
@@ -368,7 +419,11 @@ def top_models_suggested_aliases(payload: dict[str, Any]) -> dict[str, str]:
 
 async def fetch_all_providers(*, cfg: DashboardConfigProtocol) -> list[str]:
     """Extract list of all providers from health endpoint"""
-    health_data = await fetch_health(cfg=cfg)
+    return providers_from_health(await fetch_health(cfg=cfg))
+
+
+def providers_from_health(health_data: dict[str, Any]) -> list[str]:
+    """Extract provider names from an already fetched /health payload."""
     providers = health_data.get("providers", [])
 
     # Handle both dict (old format) and list (new format) for resilience
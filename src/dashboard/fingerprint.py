@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+from plotly.io.json import to_json_plotly  # type: ignore[import-untyped]
+
+
+def fingerprint(payload: Any) -> str:
+    """Stable digest of a callback payload (as serialized to the browser).
+
+    Used to return `dash.no_update` for outputs the browser already has.
+    """
+    return hashlib.blake2b(to_json_plotly(payload).encode(), digest_size=8).hexdigest()
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
 from fastapi import FastAPI
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.middleware.wsgi import WSGIMiddleware
 
 from src.core.config import Config
 from src.dashboard.app import create_dashboard
 from src.dashboard.data_sources import DashboardConfig
 
+# Dash callback responses carry whole grid rowData payloads as JSON; compress
+# them (and the layout/assets) for clients that accept gzip. Level 4 keeps the
+# CPU cost low while still shrinking repetitive row JSON several times.
+_GZIP_MINIMUM_SIZE = 1024
+_GZIP_COMPRESS_LEVEL = 4
+
 
 def mount_dashboard(*, fastapi_app: FastAPI, cfg: DashboardConfig | None = None) -> None:
     """Mount the dashboard with lazy API base URL detection.
@@ -17,7 +24,14 @@ def mount_dashboard(*, fastapi_app: FastAPI, cfg: DashboardConfig | None = None)
     config = Config()
     dash_cfg = cfg or DashboardConfig(api_base_url=f"http://localhost:{config.port}")
     dash_app = create_dashboard(cfg=dash_cfg)
-    fastapi_app.mount("/dashboard", WSGIMiddleware(dash_app.server))
+    fastapi_app.mount(
+        "/dashboard",
+        GZipMiddleware(
+            WSGIMiddleware(dash_app.server),
+            minimum_size=_GZIP_MINIMUM_SIZE,
+            compresslevel=_GZIP_COMPRESS_LEVEL,
+        ),
+    )
 
 
 class RuntimeApiConfig:
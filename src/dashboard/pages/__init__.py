@@ -25,7 +25,7 @@ from src.dashboard.pages.metrics import (
     parse_totals_for_chart,
     token_composition_chart,
 )
-from src.dashboard.pages.models import models_layout
+from src.dashboard.pages.models import models_layout, profile_tab_content
 from src.dashboard.pages.overview import overview_layout
 from src.dashboard.pages.token_counter import token_counter_layout
 from src.dashboard.pages.top_models import top_models_layout
@@ -41,6 +41,7 @@ __all__ = [
     "models_layout",
     "overview_layout",
     "parse_totals_for_chart",
+    "profile_tab_content",
     "providers_table",
     "token_composition_chart",
     "top_models_layout",
@@ -154,6 +154,7 @@ def metrics_layout() -> dbc.Container:
             dcc.Interval(id="vdm-metrics-poll", interval=5_000, n_intervals=0),
             dcc.Interval(id="vdm-metrics-user-active-poll", interval=500, n_intervals=0),
             dcc.Store(id="vdm-metrics-user-active", data=False),
+            dcc.Store(id="vdm-metrics-view-fingerprints", data=None),
             html.Div(id="vdm-sse-state", style={"display": "none"}),
         ],
         fluid=True,
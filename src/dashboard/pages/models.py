@@ -15,12 +15,11 @@ def _provider_tab_content() -> list:
                     dbc.Stack(
                         [
                             dbc.Label("Provider", className="text-muted small mb-0"),
-                            dcc.Dropdown(
+                            dbc.Select(
                                 id="vdm-models-provider-dropdown",
                                 options=[],
                                 value=None,
                                 placeholder="Select a provider...",
-                                clearable=False,
                             ),
                         ],
                         gap=1,
@@ -28,7 +27,11 @@ def _provider_tab_content() -> list:
                 )
             ]
         ),
-        html.Div(id="vdm-models-provider-hint", className="text-muted small mb-2"),
+        html.Div(
+            "Loading providers…",
+            id="vdm-models-provider-hint",
+            className="text-muted small mb-2",
+        ),
         html.Div(id="vdm-models-provider-docs-link", className="mb-3"),
         models_table(
             [],
@@ -40,8 +43,12 @@ def _provider_tab_content() -> list:
     ]
 
 
-def _profile_tab_content() -> list:
-    """Content for profile models tab."""
+def profile_tab_content() -> list:
+    """Content for profile models tab.
+
+    Not part of `models_layout`: the callbacks insert it into
+    `vdm-models-profile-tab-body` the first time the tab is opened.
+    """
     return [
         dbc.Row(
             [
@@ -49,12 +56,11 @@ def _profile_tab_content() -> list:
                     dbc.Stack(
                         [
                             dbc.Label("Profile", className="text-muted small mb-0"),
-                            dcc.Dropdown(
+                            dbc.Select(
                                 id="vdm-models-profile-dropdown",
                                 options=[],
                                 value=None,
                                 placeholder="Profile",
-                                clearable=False,
                             ),
                         ],
                         gap=1,
@@ -62,7 +68,11 @@ def _profile_tab_content() -> list:
                 )
             ]
         ),
-        html.Div(id="vdm-models-profile-hint", className="text-muted small mb-2"),
+        html.Div(
+            "Loading profiles…",
+            id="vdm-models-profile-hint",
+            className="text-muted small mb-2",
+        ),
         models_table(
             [],
             sort_field="id",
@@ -162,7 +172,8 @@ def models_layout() -> dbc.Container:
                                                     tab_id="provider-tab",
                                                 ),
                                                 dbc.Tab(
-                                                    _profile_tab_content(),
+                                                    # Built on first activation.
+                                                    html.Div(id="vdm-models-profile-tab-body"),
                                                     label="Profile Models",
                                                     tab_id="profile-tab",
                                                 ),
@@ -178,11 +189,16 @@ def models_layout() -> dbc.Container:
                     ),
                 ]
             ),
-            dcc.Store(id="vdm-models-rowdata", data=[]),
-            dcc.Store(id="vdm-models-grid-initialized", data=False),
-            # Dedicated rowData output avoids recreating the grid and preserves filters.
-            html.Div(id="vdm-models-rowdata-sink", style={"display": "none"}),
+            # Row data goes straight to each grid's rowData (no intermediate Store),
+            # which also keeps the grid, its filters and selection in place.
+            dcc.Store(id="vdm-models-provider-fingerprint", data=None),
+            dcc.Store(id="vdm-models-last-provider", data=None),
+            dcc.Store(id="vdm-models-provider-notice", data=None),
+            dcc.Store(id="vdm-models-profile-fingerprint", data=None),
+            # Paused while the tab is hidden (assets/ag_grid/42-vdm-models-poll.js).
             dcc.Interval(id="vdm-models-poll", interval=30_000, n_intervals=0),
+            # Fires once right after the shell renders to load the first data.
+            dcc.Interval(id="vdm-models-bootstrap", interval=50, max_intervals=1),
         ],
         fluid=True,
         className="py-3",
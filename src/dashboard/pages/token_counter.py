@@ -3,6 +3,9 @@ from __future__ import annotations
 import dash_bootstrap_components as dbc  # type: ignore[import-untyped]
 from dash import dcc, html
 
+# Send textarea edits to the server once typing pauses, not on every keystroke.
+_TYPING_DEBOUNCE_MS = 250
+
 
 def token_counter_layout() -> dbc.Container:
     """Layout for the Token Counter tool with real-time counting."""
@@ -52,6 +55,7 @@ def token_counter_layout() -> dbc.Container:
                                                         placeholder="Enter system message...",
                                                         rows=3,
                                                         className="mb-3",
+                                                        debounce=_TYPING_DEBOUNCE_MS,
                                                     ),
                                                 ]
                                             ),
@@ -81,6 +85,7 @@ def token_counter_layout() -> dbc.Container:
                                             ),
                                             rows=10,
                                             className="mb-3",
+                                            debounce=_TYPING_DEBOUNCE_MS,
                                         ),
                                         html.Div(
                                             "Token estimate uses a quick approximation (chars/4).",
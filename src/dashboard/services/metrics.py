@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
+from collections.abc import Callable, Coroutine
 from dataclasses import dataclass
 from typing import Any
 
@@ -13,6 +17,7 @@ from src.dashboard.components.ag_grid import (
 )
 from src.dashboard.data_sources import fetch_active_requests, fetch_running_totals
 from src.dashboard.pages import parse_totals_for_chart, token_composition_chart
+from src.dashboard.single_flight import SingleFlight
 
 
 def _provider_breakdown_component(running_totals: dict[str, Any]) -> Any:
@@ -23,7 +28,7 @@ def _model_breakdown_component(running_totals: dict[str, Any]) -> Any:
     return metrics_models_ag_grid(running_totals)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MetricsView:
     token_chart: Any
     active_requests: Any
@@ -38,8 +43,11 @@ async def build_metrics_view(*, cfg: Any) -> MetricsView:
     """
 
     # Rollup grids should be completed-only. Active requests are shown separately.
-    running = await fetch_running_totals(cfg=cfg, include_active=False)
-    active = await fetch_active_requests(cfg=cfg)
+    # The two endpoints are independent, so fetch them concurrently.
+    running, active = await asyncio.gather(
+        fetch_running_totals(cfg=cfg, include_active=False),
+        fetch_active_requests(cfg=cfg),
+    )
 
     if "# Message" in running:
         return MetricsView(
@@ -64,3 +72,48 @@ async def build_metrics_view(*, cfg: Any) -> MetricsView:
         provider_breakdown=provider_breakdown,
         model_breakdown=model_breakdown,
     )
+
+
+# Shorter than the fastest poll interval (5s): one tab always sees fresh data on
+# each tick, while several tabs polling the same proxy share a single fetch.
+METRICS_VIEW_TTL_S = 2.0
+
+_view_cache: dict[str, tuple[float, MetricsView]] = {}
+_view_cache_lock = threading.Lock()
+_view_builds: SingleFlight[MetricsView] = SingleFlight()
+
+
+def _recent_metrics_view(key: str) -> MetricsView | None:
+    with _view_cache_lock:
+        cached = _view_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < METRICS_VIEW_TTL_S:
+        return cached[1]
+    return None
+
+
+def get_metrics_view(
+    *,
+    cfg: Any,
+    run: Callable[[Coroutine[Any, Any, MetricsView]], MetricsView],
+    force: bool = False,
+) -> MetricsView:
+    """Return a recently built metrics view, building it via `run` when stale.
+
+    Concurrent callers for the same proxy wait for the in-flight build and reuse
+    it (see SingleFlight); the cache lock is never held across the fetch.
+    `force` bypasses the cache (manual refresh).
+    """
+    key = cfg.api_base_url
+    if not force and (recent := _recent_metrics_view(key)) is not None:
+        return recent
+
+    def build() -> MetricsView:
+        # A build that finished between the check above and this one is reused.
+        if not force and (recent := _recent_metrics_view(key)) is not None:
+            return recent
+        view = run(build_metrics_view(cfg=cfg))
+        with _view_cache_lock:
+            _view_cache[key] = (time.monotonic(), view)
+        return view
+
+    return _view_builds.run(key, build)
@@ -1,24 +1,34 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from dataclasses import dataclass
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass, field
 from typing import Any
 
+import httpx
 from dash import html
 
+from src.dashboard.ag_grid.transformers import cached_row_data
 from src.dashboard.components.ag_grid import models_row_data
 from src.dashboard.components.ui import provider_badge
 from src.dashboard.data_sources import (
-    fetch_all_providers,
+    DashboardDataError,
     fetch_health,
-    fetch_models,
+    fetch_models_with_digest,
     fetch_profiles,
+    providers_from_health,
 )
+from src.dashboard.fingerprint import fingerprint
+from src.dashboard.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProviderModelsView:
     row_data: list[dict[str, Any]]
     provider_options: list[dict[str, str]]
@@ -27,25 +37,60 @@ class ProviderModelsView:
     models_url: str | None = None
     error_message: str | None = None
     error_type: str | None = None
+    # Digest of everything the Provider Models tab renders from this view.
+    # Every built view is compared by the callback, so it is computed up front
+    # (once per view; cached views are reused across polls).
+    fingerprint: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "fingerprint",
+            fingerprint(
+                (
+                    self.row_data,
+                    self.provider_options,
+                    self.provider_value,
+                    self.hint,
+                    self.models_url,
+                    self.error_message,
+                    self.error_type,
+                )
+            ),
+        )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProfileModelsView:
     row_data: list[dict[str, Any]]
     profile_options: list[dict[str, str]]
     profile_value: str | None
     hint: Any  # Can be html.Span or list[html.Span | html.Any]
+    # Digest of everything the Profile Models tab renders from this view.
+    fingerprint: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "fingerprint",
+            fingerprint((self.row_data, self.profile_options, self.profile_value, self.hint)),
+        )
 
 
 def _classify_error(error_message: str) -> str:
     """Classify error type from message.
 
-    Returns error type string for UI display and icon selection.
+    Returns error type string for UI display and icon selection. Categories
+    are checked in priority order (a message mentioning both a timeout and a
+    connection is a timeout), so this stays a chain of substring tests rather
+    than one leftmost-match regex.
     """
+    if not error_message:
+        return "unknown"
     msg_lower = error_message.lower()
     if "timeout" in msg_lower:
         return "timeout"
-    if "connection" in msg_lower or "connect" in msg_lower:
+    if "connect" in msg_lower:  # also matches "connection"
         return "connection"
     if "401" in msg_lower or "403" in msg_lower or "auth" in msg_lower:
         return "auth"
@@ -56,45 +101,68 @@ def _classify_error(error_message: str) -> str:
     return "unknown"
 
 
-def _format_error_message(
-    error_message: str,
-    provider: str | None,
-) -> str:
-    """Format error message with provider context.
+# Failures of the models fetch itself, shown inline on the Provider Models tab.
+_MODELS_FETCH_ERRORS = (DashboardDataError, httpx.HTTPError, TimeoutError)
 
-    Extracts the core error message from DashboardDataError which already
-    includes provider context, and formats it for display.
-    """
-    # The error message already has provider context from fetch_models()
-    # Just return it as-is for display
-    return error_message
 
+# /health only changes when the proxy config does; switching between providers
+# in the dropdown within this window reuses one payload.
+HEALTH_TTL_S = 5.0
+
+_health_cache: dict[str, tuple[float, dict[str, Any]]] = {}
 
-async def build_provider_models_view(*, cfg: Any, provider_value: str | None) -> ProviderModelsView:
-    """Fetch models and build view fragments for the Provider Models tab."""
 
+async def _fetch_health_cached(cfg: Any) -> dict[str, Any]:
+    # Plain dict reads/writes are atomic under the GIL; a racing miss only costs
+    # one extra /health request, so no lock is held across the await.
+    cached = _health_cache.get(cfg.api_base_url)
+    if cached is not None and time.monotonic() - cached[0] < HEALTH_TTL_S:
+        return cached[1]
     health = await fetch_health(cfg=cfg)
-    providers = await fetch_all_providers(cfg=cfg)
+    _health_cache[cfg.api_base_url] = (time.monotonic(), health)
+    return health
+
+
+async def build_provider_models_view(*, cfg: Any, provider_value: str | None) -> ProviderModelsView:
+    """Fetch models and build view fragments for the Provider Models tab.
+
+    With a provider selected, the /health and models requests are independent
+    and run concurrently.
+    """
+
+    models_result: tuple[dict[str, Any], str] | BaseException | None = None
+    if provider_value:
+        gathered = await asyncio.gather(
+            _fetch_health_cached(cfg),
+            fetch_models_with_digest(cfg=cfg, provider=provider_value.strip() or None),
+            return_exceptions=True,
+        )
+        health_result, models_result = gathered
+        if isinstance(health_result, BaseException):
+            raise health_result
+        health = health_result
+    else:
+        health = await _fetch_health_cached(cfg)
+    providers = providers_from_health(health)
 
     default_provider = health.get("default_provider")
     if not isinstance(default_provider, str):
         default_provider = ""
 
-    sorted_providers = sorted(p for p in providers if isinstance(p, str) and p)
-
-    # Build provider options first (needed for dropdown)
+    # Build provider options first (needed for dropdown): sorted, with the
+    # default provider (when listed) pulled to the front in the same pass.
     provider_options: list[dict[str, str]] = []
-    if default_provider and default_provider in sorted_providers:
-        provider_options.append(
-            {"label": f"{default_provider} (default)", "value": default_provider}
-        )
-
-    provider_options.extend(
-        [{"label": p, "value": p} for p in sorted_providers if p != default_provider]
-    )
+    default_option: dict[str, str] | None = None
+    for p in sorted(p for p in providers if isinstance(p, str) and p):
+        if p == default_provider:
+            default_option = {"label": f"{p} (default)", "value": p}
+        else:
+            provider_options.append({"label": p, "value": p})
+    if default_option is not None:
+        provider_options.insert(0, default_option)
 
     # If no provider selected, return empty state (don't auto-select or fetch)
-    if not provider_value:
+    if not provider_value or models_result is None:
         return ProviderModelsView(
             row_data=[],
             provider_options=provider_options,
@@ -112,22 +180,22 @@ async def build_provider_models_view(*, cfg: Any, provider_value: str | None) ->
         provider_badge(selected_provider),
     ]
 
-    # Get models_url from health endpoint
-    providers_dict = health.get("providers", {})
-    provider_info = (
-        providers_dict.get(selected_provider, {}) if isinstance(providers_dict, dict) else {}
-    )
-    models_url = provider_info.get("models_url") if isinstance(provider_info, dict) else None
-
-    # Fetch models with error handling
-    try:
-        models_data = await fetch_models(cfg=cfg, provider=selected_provider or None)
-        models = models_data.get("data", [])
-    except Exception as e:
-        # Classify and format error for elegant display
+    # Get models_url from health endpoint. "providers" is a list in the newer
+    # /health format, so probe for .get instead of type-checking each level.
+    providers_get = getattr(health.get("providers"), "get", None)
+    info_get = getattr(providers_get(selected_provider) if providers_get else None, "get", None)
+    models_url = info_get("models_url") if info_get else None
+
+    # Models fetch failures are shown inline; anything else (cancellation,
+    # programming errors) propagates.
+    if isinstance(models_result, BaseException):
+        if not isinstance(models_result, _MODELS_FETCH_ERRORS):
+            raise models_result
+        e = models_result
+        # DashboardDataError messages from fetch_models_with_digest() already name the
+        # provider, so they are displayed as-is.
         error_message = str(e)
-        error_type = _classify_error(error_message)
-        formatted_error = _format_error_message(error_message, selected_provider)
+        error_type = getattr(e, "error_type", None) or _classify_error(error_message)
 
         logger.debug(
             f"Failed to fetch models for {selected_provider}: {e}",
@@ -140,15 +208,12 @@ async def build_provider_models_view(*, cfg: Any, provider_value: str | None) ->
             provider_value=selected_provider or None,
             hint=hint,
             models_url=models_url,
-            error_message=formatted_error,
+            error_message=error_message,
             error_type=error_type,
         )
 
-    inferred_provider = selected_provider or default_provider or "multiple"
-    for model in models:
-        if not model.get("provider"):
-            model["provider"] = inferred_provider
-
+    models_data, models_digest = models_result
+    models = models_data.get("data", [])
     if not models:
         return ProviderModelsView(
             row_data=[],
@@ -160,7 +225,12 @@ async def build_provider_models_view(*, cfg: Any, provider_value: str | None) ->
         )
 
     return ProviderModelsView(
-        row_data=models_row_data(models),
+        row_data=cached_row_data(
+            models_row_data,
+            models,
+            digest=models_digest,
+            default_provider=selected_provider or default_provider or None,
+        ),
         provider_options=provider_options,
         provider_value=selected_provider or None,
         hint=hint,
@@ -169,11 +239,176 @@ async def build_provider_models_view(*, cfg: Any, provider_value: str | None) ->
     )
 
 
+# Stale-while-revalidate for the Provider Models tab: a cached view older than
+# this is still returned immediately, while a background thread rebuilds it.
+PROVIDER_MODELS_STALE_AFTER_S = 10.0
+# A manual refresh this soon after the last build (e.g. a click landing on top of
+# a poll tick, or a double click) is served from the cache instead.
+MODELS_REFRESH_COOLDOWN_S = 2.0
+
+# Views are keyed on the dropdown value the browser sends, so both view caches
+# are LRU-bounded; a real deployment has far fewer providers/profiles than this.
+_MODELS_VIEW_CACHE_SIZE = 32
+
+_provider_view_cache: OrderedDict[tuple[str, str | None], tuple[float, ProviderModelsView]] = (
+    OrderedDict()
+)
+_provider_view_refreshing: set[tuple[str, str | None]] = set()
+_provider_view_lock = threading.Lock()
+# Shared by inline and background builds, so a cold miss, a manual refresh and
+# a revalidation for the same provider never fetch concurrently.
+_provider_view_builds: SingleFlight[ProviderModelsView] = SingleFlight()
+
+
+def _cache_view(cache: OrderedDict[Any, tuple[float, Any]], key: Any, view: Any) -> None:
+    """Store `view` as the most recent entry, evicting the least recently used."""
+    cache[key] = (time.monotonic(), view)
+    cache.move_to_end(key)
+    while len(cache) > _MODELS_VIEW_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _build_provider_models_view_once(
+    key: tuple[str, str | None],
+    cfg: Any,
+    run: Callable[[Coroutine[Any, Any, ProviderModelsView]], ProviderModelsView],
+    *,
+    reuse_recent: bool = True,
+) -> ProviderModelsView:
+    def build() -> ProviderModelsView:
+        # An inline build that finished just before this one (e.g. while this
+        # caller was checking the cache) is reused rather than repeated.
+        if reuse_recent:
+            with _provider_view_lock:
+                cached = _provider_view_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < MODELS_REFRESH_COOLDOWN_S:
+                return cached[1]
+        view = run(build_provider_models_view(cfg=cfg, provider_value=key[1]))
+        with _provider_view_lock:
+            _cache_view(_provider_view_cache, key, view)
+        return view
+
+    return _provider_view_builds.run(key, build)
+
+
+def _refresh_provider_models_view(
+    key: tuple[str, str | None],
+    cfg: Any,
+    run: Callable[[Coroutine[Any, Any, ProviderModelsView]], ProviderModelsView],
+) -> None:
+    try:
+        _build_provider_models_view_once(key, cfg, run, reuse_recent=False)
+    except Exception:
+        logger.exception("dashboard.models: background provider refresh failed")
+    finally:
+        with _provider_view_lock:
+            _provider_view_refreshing.discard(key)
+
+
+def get_provider_models_view(
+    *,
+    cfg: Any,
+    provider_value: str | None,
+    run: Callable[[Coroutine[Any, Any, ProviderModelsView]], ProviderModelsView],
+    force: bool = False,
+) -> ProviderModelsView:
+    """Return the Provider Models view without blocking on a slow provider.
+
+    The first request for a provider (or a `force`d manual refresh) builds the
+    view inline; a `force` within MODELS_REFRESH_COOLDOWN_S of the last build
+    reuses it. After that the cached view is returned right away; once it is
+    older than PROVIDER_MODELS_STALE_AFTER_S a single background rebuild is
+    started and its result is served from the next poll on. Dash runs each
+    callback on a short-lived event loop, so the rebuild uses a thread rather
+    than an asyncio task. Concurrent builds for one provider are coalesced
+    (see SingleFlight); no lock is held while fetching.
+    """
+    key = (cfg.api_base_url, provider_value)
+    with _provider_view_lock:
+        cached = _provider_view_cache.get(key)
+        if cached is not None and (
+            not force or time.monotonic() - cached[0] < MODELS_REFRESH_COOLDOWN_S
+        ):
+            _provider_view_cache.move_to_end(key)
+            if (
+                time.monotonic() - cached[0] >= PROVIDER_MODELS_STALE_AFTER_S
+                and key not in _provider_view_refreshing
+            ):
+                _provider_view_refreshing.add(key)
+                threading.Thread(
+                    target=_refresh_provider_models_view,
+                    args=(key, cfg, run),
+                    name="vdm-provider-models-refresh",
+                    daemon=True,
+                ).start()
+            return cached[1]
+
+    return _build_provider_models_view_once(key, cfg, run)
+
+
+_profile_view_cache: OrderedDict[tuple[str, str | None], tuple[float, ProfileModelsView]] = (
+    OrderedDict()
+)
+_profile_view_lock = threading.Lock()
+_profile_view_builds: SingleFlight[ProfileModelsView] = SingleFlight()
+
+
+def _recent_profile_view(key: tuple[str, str | None]) -> ProfileModelsView | None:
+    with _profile_view_lock:
+        cached = _profile_view_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < MODELS_REFRESH_COOLDOWN_S:
+        return cached[1]
+    return None
+
+
+def get_profile_models_view(
+    *,
+    cfg: Any,
+    profile_value: str | None,
+    run: Callable[[Coroutine[Any, Any, ProfileModelsView]], ProfileModelsView],
+) -> ProfileModelsView:
+    """Return the Profile Models view, rebuilt at most once per MODELS_REFRESH_COOLDOWN_S.
+
+    The bootstrap, poll and refresh inputs can fire within milliseconds of each
+    other; those calls share one in-flight build per profile (see SingleFlight),
+    while other profiles and sessions are not held up by it.
+    """
+    key = (cfg.api_base_url, profile_value)
+    if (recent := _recent_profile_view(key)) is not None:
+        return recent
+
+    def build() -> ProfileModelsView:
+        # A build that finished between the check above and this one is reused.
+        if (recent := _recent_profile_view(key)) is not None:
+            return recent
+        view = run(build_profile_models_view(cfg=cfg, profile_value=profile_value))
+        with _profile_view_lock:
+            _cache_view(_profile_view_cache, key, view)
+        return view
+
+    return _profile_view_builds.run(key, build)
+
+
 async def build_profile_models_view(*, cfg: Any, profile_value: str | None) -> ProfileModelsView:
-    """Fetch models and build view fragments for the Profile Models tab."""
+    """Fetch models and build view fragments for the Profile Models tab.
 
-    # Fetch profiles list
-    profiles_data = await fetch_profiles(cfg=cfg)
+    With a profile selected, its models are fetched concurrently with the
+    profiles list (the selection is used as given, so it does not depend on it).
+    """
+
+    models_result: tuple[dict[str, Any], str] | BaseException | None = None
+    if profile_value:
+        gathered = await asyncio.gather(
+            fetch_profiles(cfg=cfg),
+            fetch_models_with_digest(cfg=cfg, provider=f"#{profile_value}"),
+            return_exceptions=True,
+        )
+        profiles_result, models_result = gathered
+        if isinstance(profiles_result, BaseException):
+            raise profiles_result
+        profiles_data = profiles_result
+    else:
+        profiles_data = await fetch_profiles(cfg=cfg)
     profiles = [p["name"] for p in profiles_data.get("data", [])]
 
     # Build dropdown options
@@ -188,15 +423,17 @@ async def build_profile_models_view(*, cfg: Any, profile_value: str | None) -> P
     hint: Any = html.Span("Select a profile", className="text-muted")
 
     if selected:
-        models_data = await fetch_models(cfg=cfg, provider=f"#{selected}")
+        if models_result is None:
+            models_result = await fetch_models_with_digest(cfg=cfg, provider=f"#{selected}")
+        elif isinstance(models_result, BaseException):
+            raise models_result
+        models_data, models_digest = models_result
         models = models_data.get("data", [])
 
-        # Add profile context to models
-        for model in models:
-            if not model.get("provider"):
-                model["provider"] = selected
-
-        row_data = models_row_data(models)
+        # Models without a provider are attributed to the profile
+        row_data = cached_row_data(
+            models_row_data, models, digest=models_digest, default_provider=selected
+        )
         hint = [html.Span("Profile: "), provider_badge(selected)]
 
     return ProfileModelsView(
@@ -34,47 +34,37 @@ def openrouter_model_dict_to_top_model(raw: dict[str, Any]) -> TopModel | None:
     if not isinstance(context_window, int):
         context_window = None
 
-    capabilities: list[str] = []
     # OpenRouter's schema has varied over time; keep parsing resilient.
-    for key in ("capabilities", "modalities", "tags"):
-        v = raw.get(key)
-        if isinstance(v, list):
-            for item in v:
-                if isinstance(item, str):
-                    capabilities.append(item)
-
-    pricing = TopModelPricing()
+    # Keys of an insertion-ordered dict: deduplicated while collecting.
+    capabilities: dict[str, None] = {
+        item: None
+        for key in ("capabilities", "modalities", "tags")
+        if isinstance(v := raw.get(key), list)
+        for item in v
+        if isinstance(item, str)
+    }
+
+    input_per_million: float | None = None
+    output_per_million: float | None = None
 
     # OpenRouter catalog payload uses `pricing.prompt/completion`.
     # Our `/v1/models?format=openai` converter drops unknown fields and only preserves `id`.
-    # So we also accept an already-normalized `{input_per_million, output_per_million}` shape.
+    # So we also accept an already-normalized `{input_per_million, output_per_million}` shape,
+    # which takes precedence.
     pricing_raw = raw.get("pricing")
     if isinstance(pricing_raw, dict):
         prompt = pricing_raw.get("prompt")
         completion = pricing_raw.get("completion")
-        if isinstance(prompt, (int, float, str)):
-            pricing = TopModelPricing(
-                input_per_million=float(prompt) * 1_000_000,
-                output_per_million=pricing.output_per_million,
-            )
-        if isinstance(completion, (int, float, str)):
-            pricing = TopModelPricing(
-                input_per_million=pricing.input_per_million,
-                output_per_million=float(completion) * 1_000_000,
-            )
-
         input_pm = pricing_raw.get("input_per_million")
         output_pm = pricing_raw.get("output_per_million")
         if isinstance(input_pm, (int, float, str)):
-            pricing = TopModelPricing(
-                input_per_million=float(input_pm),
-                output_per_million=pricing.output_per_million,
-            )
+            input_per_million = float(input_pm)
+        elif isinstance(prompt, (int, float, str)):
+            input_per_million = float(prompt) * 1_000_000
         if isinstance(output_pm, (int, float, str)):
-            pricing = TopModelPricing(
-                input_per_million=pricing.input_per_million,
-                output_per_million=float(output_pm),
-            )
+            output_per_million = float(output_pm)
+        elif isinstance(completion, (int, float, str)):
+            output_per_million = float(completion) * 1_000_000
 
     return TopModel(
         id=model_id,
@@ -82,8 +72,11 @@ def openrouter_model_dict_to_top_model(raw: dict[str, Any]) -> TopModel | None:
         provider=provider,
         sub_provider=sub_provider,
         context_window=context_window,
-        capabilities=tuple(dict.fromkeys(capabilities)),
-        pricing=pricing,
+        capabilities=tuple(capabilities),
+        pricing=TopModelPricing(
+            input_per_million=input_per_million,
+            output_per_million=output_per_million,
+        ),
     )
 
 
@@ -112,15 +105,9 @@ class OpenRouterTopModelsSource:
         if not isinstance(data, list):
             raise TopModelsSourceError("OpenRouter models response missing 'data' list")
 
-        models: list[TopModel] = []
-        for raw in data:
-            if not isinstance(raw, dict):
-                continue
-
-            model = openrouter_model_dict_to_top_model(raw)
-            if model is None:
-                continue
-
-            models.append(model)
-
-        return tuple(models)
+        return tuple(
+            model
+            for raw in data
+            if isinstance(raw, dict)
+            and (model := openrouter_model_dict_to_top_model(raw)) is not None
+        )
@@ -132,8 +132,9 @@ def pytest_collection_modifyitems(config, items):
 
         # Legacy handling for tests in root tests/ directory
         elif "tests/" in path:
-            # Assume they're unit tests if they use TestClient
-            if "TestClient" in item.function.__code__.co_names:
+            # Assume they're unit tests if they use TestClient or are marked unit
+            # (e.g. a module-level `pytestmark = pytest.mark.unit`)
+            if item.get_closest_marker("unit") or "TestClient" in item.function.__code__.co_names:
                 item.add_marker(pytest.mark.unit)
             # Otherwise mark as integration
             else:
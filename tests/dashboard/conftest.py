@@ -0,0 +1,58 @@
+"""Shared fixtures for dashboard tests."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+
+class RecordingApp:
+    """Stand-in for dash.Dash that captures server-side callbacks by function name."""
+
+    def __init__(self) -> None:
+        self.callbacks: dict[str, Callable[..., Any]] = {}
+
+    def callback(self, *args: Any, **kwargs: Any) -> Callable[..., Any]:
+        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            self.callbacks[func.__name__] = func
+            return func
+
+        return decorator
+
+    def clientside_callback(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+
+@pytest.fixture
+def recording_app() -> RecordingApp:
+    """Pass as `app=` to a register_*_callbacks function, then call `.callbacks[name]`."""
+    return RecordingApp()
+
+
+class ConcurrencyBarrier:
+    """Two-party rendezvous for fakes that must be awaited concurrently.
+
+    Each fake calls `await barrier.arrive(name)`. Both return once both have
+    arrived. If the code under test awaits them one after the other, the first
+    never returns and the wait times out.
+    """
+
+    def __init__(self, parties: int = 2, timeout: float = 1.0) -> None:
+        self.arrived: set[str] = set()
+        self._parties = parties
+        self._timeout = timeout
+        self._all_arrived = asyncio.Event()
+
+    async def arrive(self, name: str) -> None:
+        self.arrived.add(name)
+        if len(self.arrived) == self._parties:
+            self._all_arrived.set()
+        await asyncio.wait_for(self._all_arrived.wait(), timeout=self._timeout)
+
+
+@pytest.fixture
+def concurrency_barrier() -> ConcurrencyBarrier:
+    return ConcurrencyBarrier()
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import re
 from pathlib import Path
 
+import pytest
+
 from src.dashboard.app import create_dashboard
 from src.dashboard.data_sources import DashboardConfig
 
@@ -30,7 +33,6 @@ def test_ag_grid_asset_files_exist() -> None:
     helpers_content = helpers_js.read_text(encoding="utf-8")
     assert "window.vdmCopyText" in helpers_content
     assert "window.vdmCopySelectedModelIds" in helpers_content
-    assert "window.vdmDateComparator" in helpers_content
     assert "window.escapeHtml" in helpers_content
 
     # Verify init file contains registration logic
@@ -38,7 +40,35 @@ def test_ag_grid_asset_files_exist() -> None:
     assert "window.dashAgGridFunctions" in init_content
     assert "window.dashAgGridComponentFunctions" in init_content
     assert "vdmToast" in init_content
-    assert "vdmAttachModelCellCopyListener" in init_content
+    assert "initModelCellCopyDelegation" in init_content
+
+    # Shared grid CSS is a static stylesheet, not injected at script load
+    theme_css = assets_dir / "vdm-grid-theme.css"
+    assert ".ag-row-even" in theme_css.read_text(encoding="utf-8")
+    assert "ensureStripedRowsCss" not in renderers_content
+
+    # Model detail drawer is rendered clientside
+    details_js = assets_dir / "40-vdm-model-details.js"
+    assert "dash_clientside.vdm_models.render_model_details" in details_js.read_text(
+        encoding="utf-8"
+    )
+    notice_js = assets_dir / "41-vdm-models-notice.js"
+    assert "dash_clientside.vdm_models.render_provider_notice" in notice_js.read_text(
+        encoding="utf-8"
+    )
+
+
+def test_model_id_copy_selector_targets_models_page_grids() -> None:
+    """Click-to-copy must target the grid ids the Models page actually renders."""
+    root = Path(__file__).resolve().parents[2]
+    init_js = (root / "assets" / "ag_grid" / "30-vdm-grid-init.js").read_text(encoding="utf-8")
+    models_page = (root / "src" / "dashboard" / "pages" / "models.py").read_text(encoding="utf-8")
+
+    selector_ids = set(re.findall(r"'#([\w-]+) \.ag-cell\[col-id=\"id\"\]'", init_js))
+    page_grid_ids = set(re.findall(r'grid_id="([\w-]+)"', models_page))
+
+    assert page_grid_ids == {"vdm-models-provider-grid", "vdm-models-profile-grid"}
+    assert selector_ids == page_grid_ids
 
 
 def test_ag_grid_clientside_callback_returns_empty_string() -> None:
@@ -59,6 +89,38 @@ def test_ag_grid_clientside_callback_returns_empty_string() -> None:
     assert "vdm-logs-traces-grid" in callbacks
 
 
+def test_ag_grid_bundle_replaces_sources_only_when_fresh(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The bundle is served only when it is newer than every source script."""
+    import os
+    import re
+
+    from src.dashboard.ag_grid.scripts import ag_grid_assets_ignore, build_ag_grid_bundle
+
+    monkeypatch.delenv("VDM_DASHBOARD_JS_SOURCES", raising=False)
+    ag_grid_dir = tmp_path / "ag_grid"
+    ag_grid_dir.mkdir()
+    (ag_grid_dir / "10-vdm-a.js").write_text("window.a = 1", encoding="utf-8")
+    (ag_grid_dir / "20-vdm-b.js").write_text("window.b = 2", encoding="utf-8")
+
+    # No bundle yet: ignore the bundle name, serve sources.
+    assert re.search(ag_grid_assets_ignore(tmp_path), "vdm-grid.bundle.js")
+
+    bundle = build_ag_grid_bundle(tmp_path, minify=False)
+    text = bundle.read_text(encoding="utf-8")
+    assert text.index("window.a = 1") < text.index("window.b = 2")
+
+    ignore = ag_grid_assets_ignore(tmp_path)
+    assert re.search(ignore, "10-vdm-a.js")
+    assert not re.search(ignore, "vdm-grid.bundle.js")
+
+    # Editing a source makes the bundle stale.
+    stale = bundle.stat().st_mtime - 10
+    os.utime(bundle, (stale, stale))
+    assert re.search(ag_grid_assets_ignore(tmp_path), "vdm-grid.bundle.js")
+
+
 def test_create_dashboard_smoke() -> None:
     app = create_dashboard(cfg=DashboardConfig(api_base_url="http://localhost:8082"))
     assert app is not None
@@ -66,6 +128,33 @@ def test_create_dashboard_smoke() -> None:
     assert app.title == "Vandamme Dashboard"
 
 
+def test_dashboard_assets_are_browser_cacheable() -> None:
+    """AG Grid scripts are served from /assets with a cacheable max-age."""
+    app = create_dashboard(cfg=DashboardConfig(api_base_url="http://localhost:8082"))
+    response = app.server.test_client().get("/assets/ag_grid/10-vdm-grid-renderers.js")
+    assert response.status_code == 200
+    assert "max-age=86400" in (response.headers.get("Cache-Control") or "")
+
+
+def test_mounted_dashboard_gzips_responses() -> None:
+    """Dash responses (layout, callback rowData) are gzip-compressed when accepted."""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from src.dashboard.mount import mount_dashboard
+
+    api = FastAPI()
+    mount_dashboard(fastapi_app=api, cfg=DashboardConfig(api_base_url="http://localhost:8082"))
+    client = TestClient(api)
+
+    response = client.get("/dashboard/_dash-layout", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers.get("Content-Encoding") == "gzip"
+
+    response = client.get("/dashboard/_dash-layout", headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in response.headers
+
+
 def test_models_detail_drawer_ids_exist() -> None:
     """Smoke-check that models layout includes the detail drawer + store IDs."""
 
@@ -99,4 +188,19 @@ def test_models_detail_drawer_ids_exist() -> None:
     assert "vdm-model-details-body" in ids
     assert "vdm-model-details-close" in ids
 
+    # The profile tab is built on first activation (render_profile_tab).
+    assert "vdm-models-profile-tab-body" in ids
+    assert "vdm-models-profile-grid" not in ids
+
+    # The drawer is a static skeleton; render_model_details fills one slot per field
+    # and must return the field values in the order the layout declares them.
+    from src.dashboard.components.ui import MODEL_DETAIL_FIELD_KEYS, model_detail_field_id
+
+    assert {model_detail_field_id(key) for key in MODEL_DETAIL_FIELD_KEYS} <= ids
+    assets_dir = Path(__file__).resolve().parents[2] / "assets" / "ag_grid"
+    details_js = (assets_dir / "40-vdm-model-details.js").read_text(encoding="utf-8")
+    js_keys = re.search(r"VDM_DETAIL_FIELD_KEYS = Object.freeze\(\[(.*?)\]\)", details_js, re.S)
+    assert js_keys is not None
+    assert tuple(re.findall(r"'(\w+)'", js_keys.group(1))) == MODEL_DETAIL_FIELD_KEYS
+
     # Raw JSON is rendered inside the drawer body; presence is validated by render smoke.
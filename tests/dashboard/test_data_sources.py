@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from src.dashboard import data_sources
+from src.dashboard.data_sources import (
+    DashboardConfig,
+    DashboardDataError,
+    fetch_models,
+    fetch_models_with_digest,
+)
+
+pytestmark = pytest.mark.unit
+
+_CFG = DashboardConfig(api_base_url="http://localhost:8082")
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+async def test_fetch_models_decodes_with_or_without_orjson(
+    respx_mock, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(data_sources, "orjson", None)
+    elif data_sources.orjson is None:
+        pytest.skip("orjson is not installed")
+
+    respx_mock.get("http://localhost:8082/v1/models").mock(
+        return_value=httpx.Response(200, json={"data": [{"id": "m1", "name": "Ünïcode"}]})
+    )
+
+    assert await fetch_models(cfg=_CFG, provider="openai") == {
+        "data": [{"id": "m1", "name": "Ünïcode"}]
+    }
+
+
+async def test_fetch_models_digest_tracks_response_body(respx_mock) -> None:
+    route = respx_mock.get("http://localhost:8082/v1/models")
+    route.mock(return_value=httpx.Response(200, json={"data": [{"id": "m1"}]}))
+    _, first = await fetch_models_with_digest(cfg=_CFG)
+    _, again = await fetch_models_with_digest(cfg=_CFG)
+
+    route.mock(return_value=httpx.Response(200, json={"data": [{"id": "m2"}]}))
+    payload, changed = await fetch_models_with_digest(cfg=_CFG)
+
+    assert first == again
+    assert changed != first
+    assert payload == {"data": [{"id": "m2"}]}
+
+
+async def test_fetch_models_reports_invalid_json(respx_mock) -> None:
+    respx_mock.get("http://localhost:8082/v1/models").mock(
+        return_value=httpx.Response(200, content=b"not json")
+    )
+
+    with pytest.raises(DashboardDataError, match="Failed to parse JSON"):
+        await fetch_models(cfg=_CFG)
+
+
+@pytest.mark.parametrize(
+    ("status", "expected"),
+    [(401, "auth"), (404, "not_found"), (503, "server_error"), (418, None)],
+)
+async def test_fetch_models_tags_status_errors(
+    respx_mock, status: int, expected: str | None
+) -> None:
+    respx_mock.get("http://localhost:8082/v1/models").mock(return_value=httpx.Response(status))
+
+    with pytest.raises(DashboardDataError) as exc_info:
+        await fetch_models(cfg=_CFG, provider="openai")
+    assert exc_info.value.error_type == expected
+
+
+async def test_fetch_models_tags_connection_errors(respx_mock) -> None:
+    respx_mock.get("http://localhost:8082/v1/models").mock(
+        side_effect=httpx.ConnectError("refused")
+    )
+
+    with pytest.raises(DashboardDataError) as exc_info:
+        await fetch_models(cfg=_CFG)
+    assert exc_info.value.error_type == "connection"
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Any
+
+import dash
+import pytest
+from dash import html
+
+from src.dashboard.callbacks.metrics import register_metrics_callbacks
+from src.dashboard.data_sources import DashboardConfig
+from src.dashboard.services import metrics as metrics_service
+from src.dashboard.services.metrics import MetricsView
+
+pytestmark = pytest.mark.unit
+
+
+def test_refresh_metrics_skips_unchanged_outputs(
+    monkeypatch: pytest.MonkeyPatch, recording_app
+) -> None:
+    views = [
+        MetricsView(html.Div("chart"), html.Div("a1"), html.Div("p"), html.Div("m")),
+        MetricsView(html.Div("chart"), html.Div("a2"), html.Div("p"), html.Div("m")),
+    ]
+
+    async def fake_build_metrics_view(*, cfg: Any) -> MetricsView:
+        return views.pop(0)
+
+    monkeypatch.setattr(metrics_service, "build_metrics_view", fake_build_metrics_view)
+    monkeypatch.setattr(metrics_service, "_view_cache", {})
+    monkeypatch.setattr(
+        dash, "callback_context", SimpleNamespace(triggered_id="vdm-metrics-refresh")
+    )
+    register_metrics_callbacks(
+        app=recording_app,
+        cfg=DashboardConfig(api_base_url="http://localhost:8082"),
+        run=asyncio.run,
+    )
+    refresh = recording_app.callbacks["refresh_metrics"]
+
+    *first, fingerprints = refresh(0, None, True, None)
+    assert dash.no_update not in first
+
+    *second, _ = refresh(1, None, True, fingerprints)
+    assert second[0] is dash.no_update
+    assert second[1].children == "a2"
+    assert second[2] is dash.no_update
+    assert second[3] is dash.no_update
+
+
+def test_get_metrics_view_reuses_recent_build(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = 0
+
+    async def fake_build_metrics_view(*, cfg: Any) -> MetricsView:
+        nonlocal calls
+        calls += 1
+        return MetricsView(html.Div(), html.Div(), html.Div(), html.Div())
+
+    monkeypatch.setattr(metrics_service, "build_metrics_view", fake_build_metrics_view)
+    monkeypatch.setattr(metrics_service, "_view_cache", {})
+    cfg = DashboardConfig(api_base_url="http://localhost:8082")
+
+    first = metrics_service.get_metrics_view(cfg=cfg, run=asyncio.run)
+    assert metrics_service.get_metrics_view(cfg=cfg, run=asyncio.run) is first
+    assert calls == 1
+
+    assert metrics_service.get_metrics_view(cfg=cfg, run=asyncio.run, force=True) is not first
+    assert calls == 2
+
+
+def test_get_metrics_view_coalesces_concurrent_builds(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = 0
+    started = threading.Event()
+    release = threading.Event()
+
+    async def fake_build_metrics_view(*, cfg: Any) -> MetricsView:
+        nonlocal calls
+        calls += 1
+        started.set()
+        await asyncio.to_thread(release.wait, 5)
+        return MetricsView(html.Div(), html.Div(), html.Div(), html.Div())
+
+    monkeypatch.setattr(metrics_service, "build_metrics_view", fake_build_metrics_view)
+    monkeypatch.setattr(metrics_service, "_view_cache", {})
+    cfg = DashboardConfig(api_base_url="http://localhost:8082")
+
+    def get() -> MetricsView:
+        return metrics_service.get_metrics_view(cfg=cfg, run=asyncio.run)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        leader = pool.submit(get)
+        assert started.wait(timeout=5)
+        followers = [pool.submit(get) for _ in range(2)]
+        # The cache lock is not held during the build, so reads stay unblocked.
+        assert metrics_service._view_cache_lock.acquire(timeout=1)
+        metrics_service._view_cache_lock.release()
+        release.set()
+        views = [f.result(timeout=5) for f in (leader, *followers)]
+
+    assert calls == 1
+    assert views[0] is views[1] is views[2]
+
+
+async def test_build_metrics_view_fetches_totals_and_active_requests_concurrently(
+    monkeypatch: pytest.MonkeyPatch,
+    concurrency_barrier,
+) -> None:
+    async def fake_fetch_running_totals(*, cfg: Any, include_active: bool) -> dict[str, Any]:
+        await concurrency_barrier.arrive("totals")
+        return {"# Message": "Request metrics logging is disabled"}
+
+    async def fake_fetch_active_requests(*, cfg: Any) -> dict[str, Any]:
+        await concurrency_barrier.arrive("active")
+        return {"active_requests": []}
+
+    monkeypatch.setattr(metrics_service, "fetch_running_totals", fake_fetch_running_totals)
+    monkeypatch.setattr(metrics_service, "fetch_active_requests", fake_fetch_active_requests)
+
+    view = await metrics_service.build_metrics_view(
+        cfg=DashboardConfig(api_base_url="http://localhost:8082")
+    )
+
+    assert concurrency_barrier.arrived == {"totals", "active"}
+    assert view.model_breakdown is not None
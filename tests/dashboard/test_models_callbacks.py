@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import dash
+import pytest
+
+from src.dashboard.callbacks import models as models_callbacks
+from src.dashboard.callbacks.models import register_models_callbacks
+from src.dashboard.data_sources import DashboardConfig
+from src.dashboard.services.models import ProfileModelsView, ProviderModelsView
+
+pytestmark = pytest.mark.unit
+
+
+def test_refresh_provider_models_skips_reselecting_current_provider(
+    monkeypatch: pytest.MonkeyPatch,
+    recording_app,
+) -> None:
+    lookups: list[str | None] = []
+
+    def fake_get_view(*, cfg: Any, provider_value: str | None, run: Any, force: bool = False):
+        lookups.append(provider_value)
+        return ProviderModelsView(
+            row_data=[], provider_options=[], provider_value=provider_value or "openai", hint=None
+        )
+
+    monkeypatch.setattr(models_callbacks, "get_provider_models_view", fake_get_view)
+    register_models_callbacks(
+        app=recording_app,
+        cfg=DashboardConfig(api_base_url="http://localhost:8082"),
+        run=asyncio.run,
+    )
+    refresh = recording_app.callbacks["refresh_provider_models"]
+
+    monkeypatch.setattr(
+        dash, "callback_context", SimpleNamespace(triggered_id="vdm-models-bootstrap")
+    )
+    *_, fingerprint, last_provider = refresh(1, 0, None, None, None, None)
+    assert last_provider == "openai"
+
+    # The dropdown echoing the value the callback just set is a no-op.
+    monkeypatch.setattr(
+        dash, "callback_context", SimpleNamespace(triggered_id="vdm-models-provider-dropdown")
+    )
+    with pytest.raises(dash.exceptions.PreventUpdate):
+        refresh(1, 0, None, "openai", fingerprint, last_provider)
+    assert lookups == [None]
+
+    # Picking a different provider still refreshes.
+    *_, last_provider = refresh(1, 0, None, "anthropic", fingerprint, last_provider)
+    assert last_provider == "anthropic"
+    assert lookups == [None, "anthropic"]
+
+
+def test_refresh_profile_models_skips_unchanged_views(
+    monkeypatch: pytest.MonkeyPatch, recording_app
+) -> None:
+    def fake_get_view(*, cfg: Any, profile_value: str | None, run: Any) -> ProfileModelsView:
+        return ProfileModelsView(
+            row_data=[{"id": "m1"}], profile_options=[], profile_value="fast", hint=None
+        )
+
+    monkeypatch.setattr(models_callbacks, "get_profile_models_view", fake_get_view)
+    register_models_callbacks(
+        app=recording_app,
+        cfg=DashboardConfig(api_base_url="http://localhost:8082"),
+        run=asyncio.run,
+    )
+    refresh = recording_app.callbacks["refresh_profile_models"]
+
+    *first, fingerprint = refresh(1, 0, None, None, None)
+    assert first[0] == [{"id": "m1"}]
+
+    # A poll that yields the same view sends nothing back to the browser.
+    with pytest.raises(dash.exceptions.PreventUpdate):
+        refresh(1, 1, None, "fast", fingerprint)
+
+
+def test_render_profile_tab_builds_content_once(recording_app) -> None:
+    register_models_callbacks(
+        app=recording_app,
+        cfg=DashboardConfig(api_base_url="http://localhost:8082"),
+        run=asyncio.run,
+    )
+    render = recording_app.callbacks["render_profile_tab"]
+
+    # Not built until the profile tab is opened.
+    with pytest.raises(dash.exceptions.PreventUpdate):
+        render("provider-tab", None)
+
+    content = render("profile-tab", None)
+    assert "vdm-models-profile-grid" in repr(content)
+
+    # Switching back to it later keeps the existing grid.
+    with pytest.raises(dash.exceptions.PreventUpdate):
+        render("profile-tab", content)
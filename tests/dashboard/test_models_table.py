@@ -7,15 +7,6 @@ from src.dashboard.components.ag_grid import models_ag_grid
 from src.dashboard.data_sources import DashboardConfig, fetch_models
 
 
-class _DummyResponse:
-    def __init__(self, status_code: int, json_payload: object):
-        self.status_code = status_code
-        self._json_payload = json_payload
-
-    def json(self):
-        return self._json_payload
-
-
 @pytest.mark.asyncio
 async def test_fetch_models_requests_openai_format(monkeypatch: pytest.MonkeyPatch) -> None:
     cfg = DashboardConfig(api_base_url="http://example")
@@ -26,7 +17,7 @@ async def test_fetch_models_requests_openai_format(monkeypatch: pytest.MonkeyPat
         captured["url"] = url
         captured["params"] = params
         captured["headers"] = headers
-        return _DummyResponse(status_code=200, json_payload={"object": "list", "data": []})
+        return httpx.Response(200, json={"object": "list", "data": []})
 
     monkeypatch.setattr(httpx.AsyncClient, "get", fake_get)
 
@@ -120,6 +111,18 @@ def test_models_ag_grid_rejects_unsafe_icon_urls() -> None:
     assert row["id"] == "Claude-Sonnet-4.5"
 
 
+def test_models_ag_grid_rejects_unsafe_model_page_urls(monkeypatch: pytest.MonkeyPatch) -> None:
+    from src.dashboard.ag_grid import transformers
+
+    monkeypatch.setattr(transformers, "get_model_page_template", lambda _p: "javascript:{id}")
+    row = models_ag_grid([{"id": "gpt-4o", "created": 1758868894}]).rowData[0]
+    assert row["model_page_url"] is None
+
+    monkeypatch.setattr(transformers, "get_model_page_template", lambda _p: "https://x.test/{id}")
+    row = models_ag_grid([{"id": "gpt-4o", "created": 1758868894}]).rowData[0]
+    assert row["model_page_url"] == "https://x.test/gpt-4o"
+
+
 def test_models_ag_grid_uses_registered_model_id_renderer() -> None:
     grid = models_ag_grid([])
 
@@ -131,3 +134,19 @@ def test_models_ag_grid_uses_registered_model_id_renderer() -> None:
     assert model_id_col["cellRenderer"] == "vdmModelIdWithIconRenderer"
     # Copy-to-clipboard is handled by a JS listener attached to the grid API.
     assert model_id_col["cellStyle"]["cursor"] == "copy"
+
+
+def test_models_ag_grid_sorts_created_on_epoch_seconds() -> None:
+    col_defs = models_ag_grid([]).to_plotly_json()["props"]["columnDefs"]
+
+    created_col = next(c for c in col_defs if c.get("headerName") == "Created")
+    assert created_col["field"] == "created"
+    assert "comparator" not in created_col
+    assert created_col["valueFormatter"] == {"function": "params.data.created_iso"}
+
+
+def test_models_ag_grid_keys_rows_by_provider_and_id() -> None:
+    options = models_ag_grid([]).to_plotly_json()["props"]["dashGridOptions"]
+
+    assert options["getRowId"] == {"function": "params.data.provider + '/' + params.data.id"}
+    assert "rowModelType" not in options  # client-side model: filters/sort/selection stay local
@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from src.dashboard.data_sources import DashboardConfig, DashboardDataError
+from src.dashboard.services import models as models_service
+from src.dashboard.services.models import ProfileModelsView, ProviderModelsView
+
+pytestmark = pytest.mark.unit
+
+
+def _view(tag: str) -> ProviderModelsView:
+    return ProviderModelsView(row_data=[], provider_options=[], provider_value=tag, hint=None)
+
+
+def test_provider_models_view_is_stale_while_revalidate(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    builds: list[str] = []
+    rebuilt = threading.Event()
+
+    async def fake_build(*, cfg: Any, provider_value: str | None) -> ProviderModelsView:
+        builds.append(f"v{len(builds) + 1}")
+        if len(builds) > 1:
+            rebuilt.set()
+        return _view(builds[-1])
+
+    monkeypatch.setattr(models_service, "build_provider_models_view", fake_build)
+    monkeypatch.setattr(models_service, "_provider_view_cache", OrderedDict())
+    monkeypatch.setattr(models_service, "_provider_view_refreshing", set())
+    cfg = DashboardConfig(api_base_url="http://localhost:8082")
+
+    def get(**kwargs: Any) -> ProviderModelsView:
+        return models_service.get_provider_models_view(
+            cfg=cfg, provider_value="openai", run=asyncio.run, **kwargs
+        )
+
+    # Cold cache builds inline; a fresh entry is served without rebuilding.
+    assert get().provider_value == "v1"
+    assert get().provider_value == "v1"
+    assert builds == ["v1"]
+
+    # A stale entry is served immediately while a background rebuild runs.
+    monkeypatch.setattr(models_service, "PROVIDER_MODELS_STALE_AFTER_S", 0.0)
+    assert get().provider_value == "v1"
+    assert rebuilt.wait(timeout=5)
+    # Wait for the background thread to store its result.
+    for thread in threading.enumerate():
+        if thread.name == "vdm-provider-models-refresh":
+            thread.join(timeout=5)
+    monkeypatch.setattr(models_service, "PROVIDER_MODELS_STALE_AFTER_S", 60.0)
+    assert get().provider_value == "v2"
+
+    # A manual refresh right after a build reuses it; otherwise it rebuilds inline.
+    assert get(force=True).provider_value == "v2"
+    monkeypatch.setattr(models_service, "MODELS_REFRESH_COOLDOWN_S", 0.0)
+    assert get(force=True).provider_value == "v3"
+
+
+def test_provider_models_view_cache_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def fake_build(*, cfg: Any, provider_value: str | None) -> ProviderModelsView:
+        return _view(provider_value or "")
+
+    monkeypatch.setattr(models_service, "build_provider_models_view", fake_build)
+    monkeypatch.setattr(models_service, "_provider_view_cache", OrderedDict())
+    monkeypatch.setattr(models_service, "_MODELS_VIEW_CACHE_SIZE", 2)
+    cfg = DashboardConfig(api_base_url="http://localhost:8082")
+
+    def get(provider: str) -> ProviderModelsView:
+        return models_service.get_provider_models_view(
+            cfg=cfg, provider_value=provider, run=asyncio.run
+        )
+
+    get("openai")
+    get("anthropic")
+    get("openai")  # most recently used
+    get("made-up")
+
+    assert [key[1] for key in models_service._provider_view_cache] == ["openai", "made-up"]
+
+
+def test_provider_models_view_coalesces_concurrent_inline_builds(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    builds = 0
+    started = threading.Event()
+    release = threading.Event()
+
+    async def fake_build(*, cfg: Any, provider_value: str | None) -> ProviderModelsView:
+        nonlocal builds
+        builds += 1
+        started.set()
+        await asyncio.to_thread(release.wait, 5)
+        return _view(f"v{builds}")
+
+    monkeypatch.setattr(models_service, "build_provider_models_view", fake_build)
+    monkeypatch.setattr(models_service, "_provider_view_cache", OrderedDict())
+    monkeypatch.setattr(models_service, "_provider_view_refreshing", set())
+    cfg = DashboardConfig(api_base_url="http://localhost:8082")
+
+    def get() -> ProviderModelsView:
+        return models_service.get_provider_models_view(
+            cfg=cfg, provider_value="openai", run=asyncio.run, force=True
+        )
+
+    # Cold misses and manual refreshes arriving together share one build.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [pool.submit(get)]
+        assert started.wait(timeout=5)
+        futures += [pool.submit(get) for _ in range(2)]
+        release.set()
+        views = [f.result(timeout=5) for f in futures]
+
+    assert builds == 1
+    assert views[0] is views[1] is views[2]
+
+
+def test_profile_models_view_builds_once_per_profile_without_blocking_others(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    builds: list[str | None] = []
+    started = threading.Event()
+    release = threading.Event()
+
+    async def fake_build(*, cfg: Any, profile_value: str | None) -> ProfileModelsView:
+        builds.append(profile_value)
+        if profile_value == "slow":
+            started.set()
+            await asyncio.to_thread(release.wait, 5)
+        return ProfileModelsView(
+            row_data=[], profile_options=[], profile_value=profile_value, hint=None
+        )
+
+    monkeypatch.setattr(models_service, "build_profile_models_view", fake_build)
+    monkeypatch.setattr(models_service, "_profile_view_cache", OrderedDict())
+    cfg = DashboardConfig(api_base_url="http://localhost:8082")
+
+    def get(profile: str) -> ProfileModelsView:
+        return models_service.get_profile_models_view(
+            cfg=cfg, profile_value=profile, run=asyncio.run
+        )
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        slow = [pool.submit(get, "slow")]
+        assert started.wait(timeout=5)
+        slow.append(pool.submit(get, "slow"))
+        # A different profile is served while "slow" is still fetching.
+        assert get("fast").profile_value == "fast"
+        release.set()
+        views = [f.result(timeout=5) for f in slow]
+
+    assert views[0] is views[1]
+    assert sorted(builds, key=str) == ["fast", "slow"]
+
+
+def test_provider_models_view_fingerprint_tracks_rendered_content() -> None:
+    view = _view("openai")
+
+    assert view.fingerprint == _view("openai").fingerprint
+    assert view.fingerprint != _view("anthropic").fingerprint
+    assert not hasattr(view, "__dict__")  # slots dataclass; fingerprint is a stored field
+
+
+async def test_build_provider_models_view_fetches_health_and_models_concurrently(
+    monkeypatch: pytest.MonkeyPatch,
+    concurrency_barrier,
+) -> None:
+    async def fake_fetch_health(*, cfg: Any) -> dict[str, Any]:
+        await concurrency_barrier.arrive("health")
+        return {"providers": {"openai": {"models_url": "https://example.test/models"}}}
+
+    async def fake_fetch_models(*, cfg: Any, provider: str | None) -> tuple[dict[str, Any], str]:
+        await concurrency_barrier.arrive("models")
+        raise DashboardDataError("Connection refused")
+
+    monkeypatch.setattr(models_service, "fetch_health", fake_fetch_health)
+    monkeypatch.setattr(models_service, "fetch_models_with_digest", fake_fetch_models)
+    monkeypatch.setattr(models_service, "_health_cache", {})
+    cfg = DashboardConfig(api_base_url="http://localhost:8082")
+
+    view = await models_service.build_provider_models_view(cfg=cfg, provider_value="openai")
+
+    assert view.models_url == "https://example.test/models"
+    assert view.error_type == "connection"
+    assert view.row_data == []
+
+
+async def test_build_provider_models_view_prefers_fetcher_error_type(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def fake_fetch_health(*, cfg: Any) -> dict[str, Any]:
+        return {"providers": {"timeout-proxy": {}}}
+
+    async def fake_fetch_models(*, cfg: Any, provider: str | None) -> tuple[dict[str, Any], str]:
+        # The message alone would classify as "timeout" (it names the provider).
+        raise DashboardDataError(
+            "Failed to fetch models for provider 'timeout-proxy': HTTP 404",
+            error_type="not_found",
+        )
+
+    monkeypatch.setattr(models_service, "fetch_health", fake_fetch_health)
+    monkeypatch.setattr(models_service, "fetch_models_with_digest", fake_fetch_models)
+    monkeypatch.setattr(models_service, "_health_cache", {})
+    cfg = DashboardConfig(api_base_url="http://localhost:8082")
+
+    view = await models_service.build_provider_models_view(cfg=cfg, provider_value="timeout-proxy")
+
+    assert view.error_type == "not_found"
+
+
+async def test_build_provider_models_view_propagates_unexpected_errors(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def fake_fetch_health(*, cfg: Any) -> dict[str, Any]:
+        return {"providers": {"openai": {}}}
+
+    async def fake_fetch_models(*, cfg: Any, provider: str | None) -> tuple[dict[str, Any], str]:
+        raise KeyError("data")
+
+    monkeypatch.setattr(models_service, "fetch_health", fake_fetch_health)
+    monkeypatch.setattr(models_service, "fetch_models_with_digest", fake_fetch_models)
+    monkeypatch.setattr(models_service, "_health_cache", {})
+    cfg = DashboardConfig(api_base_url="http://localhost:8082")
+
+    with pytest.raises(KeyError):
+        await models_service.build_provider_models_view(cfg=cfg, provider_value="openai")
+
+
+async def test_build_provider_models_view_lists_default_provider_first(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def fake_fetch_health(*, cfg: Any) -> dict[str, Any]:
+        return {
+            "default_provider": "poe",
+            "providers": {"openrouter": {}, "anthropic": {}, "poe": {}},
+        }
+
+    monkeypatch.setattr(models_service, "fetch_health", fake_fetch_health)
+    monkeypatch.setattr(models_service, "_health_cache", {})
+    cfg = DashboardConfig(api_base_url="http://localhost:8082")
+
+    view = await models_service.build_provider_models_view(cfg=cfg, provider_value=None)
+
+    assert view.provider_options == [
+        {"label": "poe (default)", "value": "poe"},
+        {"label": "anthropic", "value": "anthropic"},
+        {"label": "openrouter", "value": "openrouter"},
+    ]
+
+
+async def test_build_profile_models_view_fetches_profiles_and_models_concurrently(
+    monkeypatch: pytest.MonkeyPatch,
+    concurrency_barrier,
+) -> None:
+    async def fake_fetch_profiles(*, cfg: Any) -> dict[str, Any]:
+        await concurrency_barrier.arrive("profiles")
+        return {"data": [{"name": "fast"}, {"name": "cheap"}]}
+
+    async def fake_fetch_models(*, cfg: Any, provider: str | None) -> tuple[dict[str, Any], str]:
+        assert provider == "#fast"
+        await concurrency_barrier.arrive("models")
+        return {"data": [{"id": "m1"}]}, "digest-m1"
+
+    monkeypatch.setattr(models_service, "fetch_profiles", fake_fetch_profiles)
+    monkeypatch.setattr(models_service, "fetch_models_with_digest", fake_fetch_models)
+    cfg = DashboardConfig(api_base_url="http://localhost:8082")
+
+    view = await models_service.build_profile_models_view(cfg=cfg, profile_value="fast")
+
+    assert view.profile_value == "fast"
+    assert [row["id"] for row in view.row_data] == ["m1"]
+    assert view.row_data[0]["provider"] == "fast"
+
+
+@pytest.mark.parametrize(
+    ("message", "expected"),
+    [
+        ("Connection error fetching models for provider 'x': ReadTimeout", "timeout"),
+        ("Connection error fetching models for provider 'x': ConnectError", "connection"),
+        ("HTTP error fetching models for provider 'x': 401", "auth"),
+        ("Failed to fetch models for provider 'x': HTTP 404", "not_found"),
+        ("Failed to fetch models for provider 'x': HTTP 503", "server_error"),
+        ("Failed to parse JSON", "unknown"),
+        ("", "unknown"),
+    ],
+)
+def test_classify_error_uses_category_priority(message: str, expected: str) -> None:
+    assert models_service._classify_error(message) == expected
@@ -4,14 +4,28 @@ These tests verify that the "View available models" documentation button
 displays correctly when a provider is selected on the dashboard.
 
 UI Elements:
-- Provider dropdown: #vdm-models-provider-dropdown
+- Provider dropdown: #vdm-models-provider-dropdown (native <select>)
 - Docs link container: #vdm-models-provider-docs-link
 - Docs button: #vdm-models-provider-docs-link a[href]
 - Models grid: #vdm-models-provider-grid
 """
 
 import pytest
-from playwright.async_api import expect
+from playwright.async_api import Page, expect
+
+
+async def _select_provider(page: Page, provider_name: str, timeout: float) -> None:
+    """Pick a provider in the native provider <select>.
+
+    Its options are filled in by a Dash callback, so wait until the provider's
+    option exists before selecting it.
+    """
+    await page.wait_for_selector(
+        f'#vdm-models-provider-dropdown option[value="{provider_name}"]',
+        state="attached",
+        timeout=timeout,
+    )
+    await page.select_option("#vdm-models-provider-dropdown", value=provider_name)
 
 
 @pytest.mark.e2e
@@ -42,16 +56,8 @@ async def test_docs_link_appears_on_provider_selection(
     page = dashboard_page
     provider_name = provider_with_models_url  # Use the fixture result
 
-    # Click the provider dropdown
-    await page.click("#vdm-models-provider-dropdown")
-
-    # Wait for dropdown options to appear
-    await page.wait_for_selector('[role="option"]', timeout=page_wait_timeout)
-
-    # Find the specific provider option by text
-    option = page.locator('[role="option"]').filter(has_text=provider_name)
-    await expect(option).to_be_visible()
-    await option.click()
+    # Select the provider
+    await _select_provider(page, provider_name, page_wait_timeout)
 
     # Wait for docs link to appear
     docs_button = page.locator("#vdm-models-provider-docs-link a[href]")
@@ -81,12 +87,7 @@ async def test_docs_link_persists_after_models_load(
     provider_name = provider_with_models_url
 
     # Select the specific provider
-    await page.click("#vdm-models-provider-dropdown")
-    await page.wait_for_selector('[role="option"]', timeout=page_wait_timeout)
-
-    option = page.locator('[role="option"]').filter(has_text=provider_name)
-    await expect(option).to_be_visible()
-    await option.click()
+    await _select_provider(page, provider_name, page_wait_timeout)
 
     # Wait for docs link to appear
     docs_button = page.locator("#vdm-models-provider-docs-link a[href]")
@@ -131,24 +132,14 @@ async def test_docs_link_updates_on_provider_change(
     second_provider = providers_with_docs[1]
 
     # Select first provider
-    await page.click("#vdm-models-provider-dropdown")
-    await page.wait_for_selector('[role="option"]', timeout=page_wait_timeout)
-
-    option = page.locator('[role="option"]').filter(has_text=first_provider)
-    await expect(option).to_be_visible()
-    await option.click()
+    await _select_provider(page, first_provider, page_wait_timeout)
 
     docs_button = page.locator("#vdm-models-provider-docs-link a[href]")
     await expect(docs_button).to_be_visible(timeout=page_wait_timeout)
     first_href = await docs_button.get_attribute("href")
 
     # Switch to second provider
-    await page.click("#vdm-models-provider-dropdown")
-    await page.wait_for_selector('[role="option"]', timeout=page_wait_timeout)
-
-    option = page.locator('[role="option"]').filter(has_text=second_provider)
-    await expect(option).to_be_visible()
-    await option.click()
+    await _select_provider(page, second_provider, page_wait_timeout)
 
     # Verify docs link updates (new URL)
     await expect(docs_button).to_be_visible(timeout=page_wait_timeout)
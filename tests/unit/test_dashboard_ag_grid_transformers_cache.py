@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from src.dashboard.ag_grid import transformers
+
+
+@pytest.mark.unit
+def test_cached_row_data_reuses_rows_for_identical_payloads(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(transformers, "_row_data_cache", type(transformers._row_data_cache)())
+    calls = 0
+
+    def transform(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        nonlocal calls
+        calls += 1
+        return [{"id": item["id"]} for item in items]
+
+    first = transformers.cached_row_data(transform, [{"id": "a"}], digest="d-a")
+    assert transformers.cached_row_data(transform, [{"id": "a"}], digest="d-a") is first
+    assert calls == 1
+
+    assert transformers.cached_row_data(transform, [{"id": "b"}], digest="d-b") == [{"id": "b"}]
+    assert calls == 2
+
+    # Expired entries are rebuilt so relative time labels do not go stale.
+    monkeypatch.setattr(transformers, "ROW_DATA_CACHE_TTL_S", 0.0)
+    assert transformers.cached_row_data(transform, [{"id": "a"}], digest="d-a") is not first
+    assert calls == 3
+
+
+@pytest.mark.unit
+def test_cached_row_data_hit_does_not_inspect_items(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(transformers, "_row_data_cache", type(transformers._row_data_cache)())
+
+    class _Untouchable(list[dict[str, Any]]):
+        def __iter__(self):  # type: ignore[no-untyped-def]
+            raise AssertionError("a cache hit must not walk the payload")
+
+    def transform(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        return [{"id": item["id"]} for item in items]
+
+    rows = transformers.cached_row_data(transform, [{"id": "a"}], digest="d-a")
+
+    # The key is the upstream digest alone: no serialization of the payload.
+    assert transformers.cached_row_data(transform, _Untouchable(), digest="d-a") is rows
+
+
+@pytest.mark.unit
+def test_models_row_data_defaults_provider_without_mutating_input(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(transformers, "_row_data_cache", type(transformers._row_data_cache)())
+    models = [{"id": "m1"}, {"id": "m2", "provider": "openai"}]
+
+    rows = transformers.cached_row_data(
+        transformers.models_row_data, models, digest="d", default_provider="poe"
+    )
+
+    assert [row["provider"] for row in rows] == ["poe", "openai"]
+    assert models == [{"id": "m1"}, {"id": "m2", "provider": "openai"}]
+    # The default is part of the cache key.
+    other = transformers.cached_row_data(
+        transformers.models_row_data, models, digest="d", default_provider="openrouter"
+    )
+    assert other[0]["provider"] == "openrouter"
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.dashboard.components.ui import format_timestamp
+
+
+@pytest.mark.unit
+def test_format_timestamp_parses_z_offset_and_naive_timestamps() -> None:
+    aware = datetime.now(UTC) - timedelta(minutes=5)
+    naive_local = datetime.now() - timedelta(minutes=5)
+
+    assert format_timestamp(aware.isoformat().replace("+00:00", "Z")) == "5m ago"
+    assert format_timestamp(aware.isoformat()) == "5m ago"
+    assert format_timestamp(naive_local.isoformat()) == "5m ago"
+    assert format_timestamp("not a timestamp") == "Unknown"
+    assert format_timestamp(None) == "N/A"
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.dashboard import single_flight
+from src.dashboard.single_flight import SingleFlight
+
+
+@pytest.mark.unit
+def test_single_flight_shares_one_build_per_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    waiting = threading.Event()
+
+    class _SignallingEvent(threading.Event):
+        def wait(self, timeout: float | None = None) -> bool:
+            waiting.set()
+            return super().wait(timeout)
+
+    class _SignallingCall(single_flight._Call[int]):
+        def __init__(self) -> None:
+            super().__init__()
+            self.done = _SignallingEvent()
+
+    monkeypatch.setattr(single_flight, "_Call", _SignallingCall)
+    flight: SingleFlight[int] = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[str] = []
+
+    def slow_build() -> int:
+        calls.append("slow")
+        started.set()
+        assert release.wait(timeout=5)
+        return 1
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        leader = pool.submit(flight.run, "a", slow_build)
+        assert started.wait(timeout=5)
+        follower = pool.submit(flight.run, "a", lambda: calls.append("dup") or 2)
+
+        # Another key is not held up by the in-flight build.
+        assert flight.run("b", lambda: 3) == 3
+
+        assert waiting.wait(timeout=5)  # the follower is blocked on the in-flight build
+        release.set()
+        assert leader.result(timeout=5) == 1
+        assert follower.result(timeout=5) == 1
+
+    assert calls == ["slow"]
+
+
+@pytest.mark.unit
+def test_single_flight_propagates_errors_and_forgets_the_key() -> None:
+    flight: SingleFlight[int] = SingleFlight()
+
+    def failing() -> int:
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        flight.run("a", failing)
+
+    assert flight.run("a", lambda: 7) == 7
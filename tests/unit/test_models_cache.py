@@ -228,3 +228,42 @@ class TestModelsDiskCache:
         # Should read back empty list
         result = models_cache.read_models_if_fresh(provider, base_url, headers)
         assert result == []
+
+    def test_orjson_and_stdlib_files_are_interchangeable(
+        self, models_cache, sample_models, monkeypatch
+    ):
+        """Files written with orjson read back without it, and vice versa."""
+        from src.core.cache import disk
+
+        if disk.orjson is None:
+            pytest.skip("orjson is not installed")
+
+        provider = "openai"
+        base_url = "https://api.openai.com"
+        headers = {}
+        models = [*sample_models, {"id": "modèle-ü", "object": "model", "owned_by": "ünï"}]
+
+        models_cache.write_models(provider, base_url, headers, models)
+        fast_written = models_cache.make_file_path(provider, base_url, headers).read_text()
+        assert json.loads(fast_written)["response"]["data"] == models
+
+        monkeypatch.setattr(disk, "orjson", None)
+        monkeypatch.setattr(disk.DiskJsonCache, "_parsed_files", {})
+        assert models_cache.read_models_if_fresh(provider, base_url, headers) == models
+
+        models_cache.write_models(provider, base_url, headers, models)
+        monkeypatch.undo()
+        assert models_cache.read_models_if_fresh(provider, base_url, headers) == models
+
+    def test_unchanged_cache_file_is_parsed_once(self, models_cache, sample_models):
+        """Repeated reads reuse the parsed file until it is rewritten."""
+        provider = "openai"
+        base_url = "https://api.openai.com"
+        headers = {}
+
+        models_cache.write_models(provider, base_url, headers, sample_models)
+        first = models_cache.read_models_if_fresh(provider, base_url, headers)
+        assert models_cache.read_models_if_fresh(provider, base_url, headers) is first
+
+        models_cache.write_models(provider, base_url, headers, sample_models[:1])
+        assert models_cache.read_models_if_fresh(provider, base_url, headers) == sample_models[:1]
@@ -162,3 +162,20 @@ class TestProviderManagerProfileIntegration:
 
         retries = provider_mgr.get_effective_max_retries("unknown", None)
         assert retries is None
+
+    def test_provider_names_snapshot_tracks_registry(self):
+        """Test provider_names reuses one snapshot until the registry changes."""
+        provider_mgr = ProviderManager()
+        provider_mgr._loaded = True
+        provider_mgr._registry.register(
+            ProviderConfig(name="openai", api_key="sk-test", base_url="https://api.openai.com/v1")
+        )
+
+        names = provider_mgr.provider_names()
+        assert names == frozenset({"openai"})
+        assert provider_mgr.provider_names() is names
+
+        provider_mgr._registry.register(
+            ProviderConfig(name="poe", api_key="sk-test", base_url="https://api.poe.com/v1")
+        )
+        assert provider_mgr.provider_names() == frozenset({"openai", "poe"})
@@ -67,6 +67,17 @@ class TestProviderResolver:
         with pytest.raises(ValueError, match="Available providers: anthropic, openai"):
             resolver.resolve_provider("unknown:model", available)
 
+    def test_resolve_provider_accepts_name_snapshot(self) -> None:
+        """Test resolving against a frozenset of provider names."""
+        resolver = ProviderResolver(default_provider="openai")
+        available = frozenset({"openai", "anthropic"})
+        assert resolver.resolve_provider("anthropic:claude-3", available) == (
+            "anthropic",
+            "claude-3",
+        )
+        with pytest.raises(ValueError, match="Available providers: anthropic, openai"):
+            resolver.resolve_provider("unknown:model", available)
+
     def test_get_provider_or_default_with_value(self) -> None:
         """Test getting provider name when value is provided."""
         resolver = ProviderResolver(default_provider="openai")
@@ -136,6 +147,23 @@ class TestProviderResolver:
         assert provider == "openai"
         assert model == "haiku"
 
+    def test_profile_aware_resolution_with_provider_prefixed_model(self) -> None:
+        """Test that a provider prefix after a profile prefix is still honored."""
+        from src.core.profile_manager import ProfileManager
+
+        profile_mgr = ProfileManager()
+        profile_mgr.load_profiles({"test-profile": {"aliases": {}}})
+
+        resolver = ProviderResolver(
+            default_provider="openai",
+            profile_manager=profile_mgr,
+        )
+        available = {"openai": {}, "anthropic": {}}
+
+        provider, model = resolver.resolve_provider("test-profile:Anthropic:claude-3", available)
+        assert provider == "anthropic"
+        assert model == "claude-3"
+
     def test_profile_aware_resolution_no_profile(self) -> None:
         """Test that non-profile names are handled normally."""
         from src.core.profile_manager import ProfileManager
@@ -161,6 +189,14 @@ class TestProviderResolver:
         assert provider == "openai"
         assert model == ""
 
+    def test_resolve_provider_leading_colon_uses_default(self) -> None:
+        """Test that an empty provider prefix resolves to the default provider."""
+        resolver = ProviderResolver(default_provider="openai")
+        available = {"openai": {}}
+        provider, model = resolver.resolve_provider(":free", available)
+        assert provider == "openai"
+        assert model == ":free"
+
     def test_resolve_provider_model_with_only_provider(self) -> None:
         """Test resolving model that's just a provider name with colon."""
         resolver = ProviderResolver(default_provider="openai")
@@ -159,3 +159,31 @@ def test_models_refresh_bypasses_cache(respx_mock):
     assert route.calls.call_count == 2
     assert r1.json()["data"][0]["id"] == "m"
     assert r2.json()["data"][0]["id"] == "m"
+
+
+@pytest.mark.unit
+def test_openrouter_model_dict_to_top_model_parses_pricing_and_capabilities():
+    from src.top_models.openrouter import openrouter_model_dict_to_top_model
+
+    model = openrouter_model_dict_to_top_model(
+        {
+            "id": "openai/gpt-4o",
+            "capabilities": ["vision", "tools"],
+            "modalities": ["vision", 3],
+            "tags": "not-a-list",
+            "pricing": {"prompt": "0.0000025", "completion": 1e-5},
+        }
+    )
+    assert model is not None
+    assert model.sub_provider == "openai"
+    assert model.capabilities == ("vision", "tools")
+    assert model.pricing.input_per_million == pytest.approx(2.5)
+    assert model.pricing.output_per_million == pytest.approx(10.0)
+
+    # Already-normalized per-million prices take precedence over prompt/completion.
+    normalized = openrouter_model_dict_to_top_model(
+        {"id": "m", "pricing": {"prompt": "1", "input_per_million": 3, "completion": "0.5"}}
+    )
+    assert normalized is not None
+    assert normalized.pricing.input_per_million == 3.0
+    assert normalized.pricing.output_per_million == 500_000.0